@@ -86,6 +86,9 @@ async def lifespan(app: FastAPI):
         if mcp_server:
             await mcp_server.stop()
 
+        if execution_service:
+            await execution_service.close()
+
         if registry_service:
             await registry_service.stop()
 
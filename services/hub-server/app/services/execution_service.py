@@ -101,6 +101,21 @@ class ExecutionService(LoggerMixin):
         self.config = get_config()
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
         self.active_executions: Dict[str, asyncio.Task] = {}
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300)
+            )
+        return self._http_session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
 
     async def execute_tool(
         self,
@@ -323,32 +338,32 @@ class ExecutionService(LoggerMixin):
         service_url = f"{service.service_url}/mcp"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "Content-Type": "application/json",
-                    "X-Correlation-ID": correlation_id,
-                    "X-Execution-ID": execution_id
-                }
+            session = self._get_http_session()
+            headers = {
+                "Content-Type": "application/json",
+                "X-Correlation-ID": correlation_id,
+                "X-Execution-ID": execution_id
+            }
 
-                async with session.post(
-                    service_url,
-                    json=mcp_request,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=tool.timeout_seconds)
-                ) as response:
-
-                    duration_ms = (time.time() - start_time) * 1000
-
-                    if response.status == 200:
-                        result_data = await response.json()
-                        return {
-                            "data": result_data.get("result"),
-                            "duration_ms": duration_ms,
-                            "status": "success"
-                        }
-                    else:
-                        error_data = await response.text()
-                        raise Exception(f"Service returned {response.status}: {error_data}")
+            async with session.post(
+                service_url,
+                json=mcp_request,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=tool.timeout_seconds)
+            ) as response:
+
+                duration_ms = (time.time() - start_time) * 1000
+
+                if response.status == 200:
+                    result_data = await response.json()
+                    return {
+                        "data": result_data.get("result"),
+                        "duration_ms": duration_ms,
+                        "status": "success"
+                    }
+                else:
+                    error_data = await response.text()
+                    raise Exception(f"Service returned {response.status}: {error_data}")
 
         except aiohttp.ClientError as e:
             duration_ms = (time.time() - start_time) * 1000
@@ -21,6 +21,7 @@ from shared.schemas.mcp_protocol import (
     Tool, ToolsListResponse, ToolCallRequest, ToolCallResponse, ToolResult
 )
 from shared.utils.logging import LoggerMixin, get_correlation_id, set_correlation_id
+from shared.utils.serialization import dumps_message, dumps_result
 
 from ..core.config import get_config
 from .registry_service import RegistryService
@@ -270,7 +271,7 @@ class MCPProtocolHandler(LoggerMixin):
                 tool_result = ToolResult(
                     content=[{
                         "type": "text",
-                        "text": json.dumps(result.get("result", {}), indent=2)
+                        "text": dumps_result(result.get("result", {}), default=str)
                     }],
                     is_error=False
                 )
@@ -352,7 +353,7 @@ class MCPServer(LoggerMixin):
 
             # Return response if not None (notifications return None)
             if response_data is not None:
-                return json.dumps(response_data, default=str)
+                return dumps_message(response_data)
 
             return None
 
@@ -367,7 +368,7 @@ class MCPServer(LoggerMixin):
                     "message": f"Message handling error: {str(e)}"
                 }
             }
-            return json.dumps(error_response)
+            return dumps_message(error_response)
 
     async def start(self):
         """Start MCP server"""
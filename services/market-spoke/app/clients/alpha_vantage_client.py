@@ -2,25 +2,103 @@
 Alpha Vantage API Client for Real-time Financial Data
 """
 import asyncio
+import logging
 import os
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+import time
+import random
+from typing import Dict, Any, List, Optional, Awaitable, Callable
+from datetime import datetime
+from types import MappingProxyType
 import aiohttp
+import numpy as np
 import pandas as pd
 from alpha_vantage.timeseries import TimeSeries
 from alpha_vantage.fundamentaldata import FundamentalData
 from alpha_vantage.techindicators import TechIndicators
 
+logger = logging.getLogger(__name__)
+
+
+# Value ranges and sectors the mock fallbacks draw from
+FALLBACK_INDICATOR_RANGES = MappingProxyType({
+    "RSI": (20, 80),
+    "MACD": (-2, 2),
+})
+FALLBACK_SECTORS = ('Technology', 'Healthcare', 'Financial', 'Consumer', 'Industrial')
+
+
+class AlphaVantageRateLimiter:
+    """Token bucket pacing requests to the Alpha Vantage per-minute quota
+
+    Holds up to ``capacity`` tokens, refilled continuously over ``period``
+    seconds, so short bursts go out immediately and sustained load is spread
+    evenly instead of stalling for a whole minute once the quota is spent.
+    """
+
+    def __init__(self, capacity: int, period: float = 60.0):
+        self.capacity = capacity
+        self.refill_rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= 1
+
+    def try_acquire(self, reserve: float = 0.0) -> bool:
+        """Take a token only if one is free now and ``reserve`` tokens stay behind
+
+        Never waits and never goes ahead of callers already queued in acquire,
+        so background work only spends tokens live requests are not using.
+        """
+        if self._lock.locked():
+            return False
+        self._refill()
+        if self.tokens - 1 < reserve:
+            return False
+        self.tokens -= 1
+        return True
+
 
 class AlphaVantageClient:
     """Client for Alpha Vantage API"""
 
+    # Seconds each kind of response is served from cache; the free tier allows
+    # only a handful of calls a minute and fundamentals change quarterly
+    QUOTE_CACHE_TTL = 60
+    HISTORICAL_CACHE_TTL = 3600
+    INDICATOR_CACHE_TTL = 3600
+    FUNDAMENTALS_CACHE_TTL = 86400
+
+    # Most symbols BATCH_STOCK_QUOTES accepts per request
+    BATCH_QUOTE_LIMIT = 100
+
+    # Bars returned by get_historical_data
+    HISTORICAL_ROWS = 30
+    # Layouts get_historical_data can return 'data' in
+    HISTORICAL_FORMATS = frozenset({"rows", "columns"})
+
+    # Indicators warmed in the background once a symbol's history is fetched
+    PREFETCH_INDICATORS = ("RSI", "MACD", "SMA")
+
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv('ALPHA_VANTAGE_API_KEY')
         self.base_url = "https://www.alphavantage.co/query"
 
         if not self.api_key:
-            print("Warning: No Alpha Vantage API key provided. Using demo key.")
+            logger.warning("No Alpha Vantage API key provided. Using demo key.")
             self.api_key = "demo"  # Demo key for testing
 
         # Initialize Alpha Vantage clients
@@ -30,81 +108,253 @@ class AlphaVantageClient:
 
         # Rate limiting
         self.requests_per_minute = 5 if self.api_key == "demo" else 75
-        self.request_count = 0
-        self.last_minute = datetime.now().minute
+        self.rate_limiter = AlphaVantageRateLimiter(self.requests_per_minute)
+
+        # Cleared once the API answers BATCH_STOCK_QUOTES without quotes
+        self._batch_quotes_supported = True
+
+        # Shared HTTP session so repeated calls reuse pooled connections
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Real API responses only; fallback mock data is never cached
+        self.cache: Dict[str, tuple] = {}
+        self.cache_max_entries = 512
+
+        # Requests in progress, keyed like the cache, so concurrent misses share one call
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Generators for the mock fallbacks, owned by this client rather than
+        # shared through the random/np.random module state
+        self._random = random.Random()
+        self._rng = np.random.default_rng()
+
+        # Background indicator prefetches; one runs at a time
+        self._prefetch_tasks: set = set()
+        self._prefetch_slot = asyncio.Semaphore(1)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=60, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Cancel pending prefetches and close the shared HTTP session"""
+        for task in list(self._prefetch_tasks):
+            task.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_cached(self, cache_key: str, ttl: int) -> Optional[Dict[str, Any]]:
+        """Return a cached response younger than ttl seconds"""
+        entry = self.cache.get(cache_key)
+        if entry is not None and time.monotonic() - entry[1] < ttl:
+            return entry[0]
+        return None
+
+    def _set_cached(self, cache_key: str, data: Dict[str, Any]) -> None:
+        """Cache a response, evicting the oldest entry once the cache is full"""
+        self.cache.pop(cache_key, None)
+        if len(self.cache) >= self.cache_max_entries:
+            self.cache.pop(next(iter(self.cache)))
+        self.cache[cache_key] = (data, time.monotonic())
+
+    async def _single_flight(self, cache_key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Share one request among concurrent cache misses for the same key"""
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = self._inflight[cache_key] = asyncio.create_task(fetch())
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # A cancelled caller must not cancel the request the other callers are awaiting
+        return await asyncio.shield(task)
 
     async def _check_rate_limit(self):
         """Check and enforce rate limiting"""
-        current_minute = datetime.now().minute
-
-        if current_minute != self.last_minute:
-            self.request_count = 0
-            self.last_minute = current_minute
-
-        if self.request_count >= self.requests_per_minute:
-            print(f"Rate limit reached. Waiting...")
-            await asyncio.sleep(60)
-            self.request_count = 0
-
-        self.request_count += 1
+        await self.rate_limiter.acquire()
 
     async def get_real_time_quote(self, symbol: str) -> Dict[str, Any]:
         """Get real-time quote for a symbol"""
+        cache_key = f"quote:{symbol}"
+        cached = self._get_cached(cache_key, self.QUOTE_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        return await self._single_flight(cache_key, lambda: self._fetch_real_time_quote(symbol, cache_key))
+
+    async def _fetch_real_time_quote(self, symbol: str, cache_key: str) -> Dict[str, Any]:
+        """Request a quote, falling back to mock data"""
         await self._check_rate_limit()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    'function': 'GLOBAL_QUOTE',
-                    'symbol': symbol,
-                    'apikey': self.api_key
-                }
+            session = self._get_session()
+            params = {
+                'function': 'GLOBAL_QUOTE',
+                'symbol': symbol,
+                'apikey': self.api_key
+            }
 
-                async with session.get(self.base_url, params=params) as response:
-                    data = await response.json()
-
-                    if 'Global Quote' in data:
-                        quote = data['Global Quote']
-                        return {
-                            'symbol': quote.get('01. symbol', symbol),
-                            'price': float(quote.get('05. price', 0)),
-                            'change': float(quote.get('09. change', 0)),
-                            'change_percent': quote.get('10. change percent', '0%').replace('%', ''),
-                            'volume': int(quote.get('06. volume', 0)),
-                            'latest_trading_day': quote.get('07. latest trading day'),
-                            'previous_close': float(quote.get('08. previous close', 0)),
-                            'open': float(quote.get('02. open', 0)),
-                            'high': float(quote.get('03. high', 0)),
-                            'low': float(quote.get('04. low', 0)),
-                        }
-                    else:
-                        return await self._get_fallback_quote(symbol)
+            async with session.get(self.base_url, params=params) as response:
+                data = await response.json()
+
+                if 'Global Quote' in data:
+                    quote = data['Global Quote']
+                    result = {
+                        'symbol': quote.get('01. symbol', symbol),
+                        'price': float(quote.get('05. price', 0)),
+                        'change': float(quote.get('09. change', 0)),
+                        'change_percent': quote.get('10. change percent', '0%').replace('%', ''),
+                        'volume': int(quote.get('06. volume', 0)),
+                        'latest_trading_day': quote.get('07. latest trading day'),
+                        'previous_close': float(quote.get('08. previous close', 0)),
+                        'open': float(quote.get('02. open', 0)),
+                        'high': float(quote.get('03. high', 0)),
+                        'low': float(quote.get('04. low', 0)),
+                    }
+                    self._set_cached(cache_key, result)
+                    return result
+                else:
+                    return self._get_fallback_quote(symbol)
 
         except Exception as e:
-            print(f"Alpha Vantage API error for {symbol}: {e}")
-            return await self._get_fallback_quote(symbol)
+            logger.warning("Alpha Vantage API error for %s, using fallback data: %s", symbol, e)
+            return self._get_fallback_quote(symbol)
+
+    async def get_batch_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get quotes for several symbols with BATCH_STOCK_QUOTES
+
+        Every quote has the batch shape - symbol, price, volume and timestamp -
+        whether it came from the cache, the batch response or the per-symbol
+        fallback. Symbols already in the quote cache are not requested again,
+        and symbols the batch response does not cover fall back to
+        get_real_time_quote. Once the API answers a batch request without
+        quotes (keys without access get an Information/Note message), later
+        calls skip the batch request and go straight to the fallback.
+        """
+        quotes: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            cached = self._get_cached(f"batch_quote:{symbol}", self.QUOTE_CACHE_TTL)
+            if cached is None:
+                full = self._get_cached(f"quote:{symbol}", self.QUOTE_CACHE_TTL)
+                cached = self._to_batch_quote(full) if full is not None else None
+            if cached is not None:
+                quotes[symbol] = cached
+            else:
+                missing.append(symbol)
+
+        if self._batch_quotes_supported:
+            session = self._get_session()
+            for start in range(0, len(missing), self.BATCH_QUOTE_LIMIT):
+                chunk = missing[start:start + self.BATCH_QUOTE_LIMIT]
+                await self._check_rate_limit()
+                try:
+                    params = {
+                        'function': 'BATCH_STOCK_QUOTES',
+                        'symbols': ','.join(chunk),
+                        'apikey': self.api_key
+                    }
+
+                    async with session.get(self.base_url, params=params) as response:
+                        data = await response.json()
+
+                    if 'Stock Quotes' not in data:
+                        logger.warning(
+                            "Alpha Vantage batch quotes unavailable, using per-symbol quotes: %s",
+                            data.get('Information') or data.get('Note') or data.get('Error Message') or data
+                        )
+                        self._batch_quotes_supported = False
+                        break
+
+                    for quote in data['Stock Quotes']:
+                        symbol = quote.get('1. symbol')
+                        if symbol not in chunk:
+                            continue
+                        result = {
+                            'symbol': symbol,
+                            'price': float(quote.get('2. price', 0)),
+                            'volume': int(quote.get('3. volume') or 0),
+                            'timestamp': quote.get('4. timestamp'),
+                        }
+                        self._set_cached(f"batch_quote:{symbol}", result)
+                        quotes[symbol] = result
+
+                except Exception as e:
+                    logger.warning("Alpha Vantage batch quote error for %d symbols: %s", len(chunk), e)
+
+        uncovered = [symbol for symbol in missing if symbol not in quotes]
+        if uncovered:
+            results = await asyncio.gather(*(self.get_real_time_quote(symbol) for symbol in uncovered))
+            quotes.update(zip(uncovered, map(self._to_batch_quote, results)))
 
-    async def get_historical_data(self, symbol: str, period: str = "1month") -> Dict[str, Any]:
-        """Get historical price data"""
+        return {symbol: quotes[symbol] for symbol in symbols}
+
+    @staticmethod
+    def _to_batch_quote(quote: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a GLOBAL_QUOTE result to the batch quote fields"""
+        return {
+            'symbol': quote['symbol'],
+            'price': quote['price'],
+            'volume': quote['volume'],
+            'timestamp': quote.get('latest_trading_day'),
+        }
+
+    async def get_historical_data(self, symbol: str, period: str = "1month",
+                                  data_format: str = "rows") -> Dict[str, Any]:
+        """Get historical price data
+
+        With data_format="columns", 'data' holds one list per field
+        ({"date": [...], "open": [...], ...}) instead of one dict per bar: the
+        field names are not repeated per row and pandas.DataFrame(data) loads
+        it directly. Any other data_format raises ValueError.
+        """
+        if data_format not in self.HISTORICAL_FORMATS:
+            raise ValueError(
+                f"data_format must be one of {sorted(self.HISTORICAL_FORMATS)}, got {data_format!r}"
+            )
+
+        cache_key = f"historical:{symbol}:{period}"
+        result = self._get_cached(cache_key, self.HISTORICAL_CACHE_TTL)
+        if result is None:
+            result = await self._single_flight(cache_key, lambda: self._fetch_historical_data(symbol, period, cache_key))
+
+        if data_format == "columns":
+            result = dict(result, data=self._to_columns(result['data']))
+        return result
+
+    @staticmethod
+    def _to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """Bars as one list per field, in row order"""
+        if not rows:
+            return {}
+        return {field: [row[field] for row in rows] for field in rows[0]}
+
+    async def _fetch_historical_data(self, symbol: str, period: str, cache_key: str) -> Dict[str, Any]:
+        """Request daily/weekly/monthly bars, falling back to mock data"""
         await self._check_rate_limit()
 
         try:
-            # Use pandas-based TimeSeries
-            if period in ["1day", "daily"]:
-                data, metadata = self.ts.get_daily(symbol=symbol, outputsize='compact')
-            elif period in ["1week", "weekly"]:
-                data, metadata = self.ts.get_weekly(symbol=symbol)
+            # The pandas-based TimeSeries client does blocking HTTP; run it in a
+            # worker thread so concurrent requests overlap instead of queueing
+            # on the event loop
+            if period in ["1week", "weekly"]:
+                data, metadata = await asyncio.to_thread(self.ts.get_weekly, symbol=symbol)
             elif period in ["1month", "monthly"]:
-                data, metadata = self.ts.get_monthly(symbol=symbol)
+                data, metadata = await asyncio.to_thread(self.ts.get_monthly, symbol=symbol)
             else:
-                data, metadata = self.ts.get_daily(symbol=symbol, outputsize='full')
+                # Only the latest HISTORICAL_ROWS bars are returned, which the
+                # 100-bar compact series covers; 'full' downloads 20+ years
+                data, metadata = await asyncio.to_thread(self.ts.get_daily, symbol=symbol, outputsize='compact')
 
             if data.empty:
-                return await self._get_fallback_historical(symbol, period)
+                return self._get_fallback_historical(symbol, period)
 
             # Convert to our format
             historical_data = []
-            for date, row in data.head(30).iterrows():
+            for date, row in data.head(self.HISTORICAL_ROWS).iterrows():
                 historical_data.append({
                     'date': date.strftime('%Y-%m-%d'),
                     'open': float(row['1. open']),
@@ -114,7 +364,7 @@ class AlphaVantageClient:
                     'volume': int(row['5. volume'])
                 })
 
-            return {
+            result = {
                 'symbol': symbol,
                 'period': period,
                 'data': historical_data,
@@ -124,171 +374,236 @@ class AlphaVantageClient:
                     'data_source': 'Alpha Vantage'
                 }
             }
+            self._set_cached(cache_key, result)
+            self._schedule_prefetch(symbol)
+            return result
 
         except Exception as e:
-            print(f"Historical data error for {symbol}: {e}")
-            return await self._get_fallback_historical(symbol, period)
+            logger.warning("Historical data error for %s, using fallback data: %s", symbol, e)
+            return self._get_fallback_historical(symbol, period)
+
+    def _schedule_prefetch(self, symbol: str) -> None:
+        """Warm the indicator cache for a symbol without delaying the caller"""
+        for indicator in self.PREFETCH_INDICATORS:
+            cache_key = f"indicator:{symbol}:{indicator}"
+            if cache_key in self._inflight or self._get_cached(cache_key, self.INDICATOR_CACHE_TTL) is not None:
+                continue
+            task = asyncio.create_task(self._prefetch_indicator(symbol, indicator))
+            self._prefetch_tasks.add(task)
+            task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def _prefetch_indicator(self, symbol: str, indicator: str) -> None:
+        """Fetch one indicator if the rate limit has room to spare"""
+        async with self._prefetch_slot:
+            cache_key = f"indicator:{symbol}:{indicator}"
+            if cache_key in self._inflight or self._get_cached(cache_key, self.INDICATOR_CACHE_TTL) is not None:
+                return
+            # The token is taken up front, and only while half the bucket stays
+            # reserved for live requests; a skipped prefetch just means the
+            # first real call goes to the API
+            if not self.rate_limiter.try_acquire(reserve=self.rate_limiter.capacity / 2):
+                return
+            await self._single_flight(
+                cache_key,
+                lambda: self._fetch_technical_indicators(symbol, indicator, cache_key, token_taken=True)
+            )
 
     async def get_technical_indicators(self, symbol: str, indicator: str = "RSI") -> Dict[str, Any]:
         """Get technical indicators"""
-        await self._check_rate_limit()
+        cache_key = f"indicator:{symbol}:{indicator.upper()}"
+        cached = self._get_cached(cache_key, self.INDICATOR_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        return await self._single_flight(cache_key, lambda: self._fetch_technical_indicators(symbol, indicator, cache_key))
+
+    async def _fetch_technical_indicators(self, symbol: str, indicator: str, cache_key: str,
+                                          token_taken: bool = False) -> Dict[str, Any]:
+        """Request an indicator series, falling back to mock data"""
+        if not token_taken:
+            await self._check_rate_limit()
 
         try:
+            # TechIndicators is blocking as well; keep it off the event loop
             if indicator.upper() == "RSI":
-                data, metadata = self.ti.get_rsi(symbol=symbol, interval='daily', time_period=14)
+                data, metadata = await asyncio.to_thread(self.ti.get_rsi, symbol=symbol, interval='daily', time_period=14)
             elif indicator.upper() == "MACD":
-                data, metadata = self.ti.get_macd(symbol=symbol, interval='daily')
+                data, metadata = await asyncio.to_thread(self.ti.get_macd, symbol=symbol, interval='daily')
             elif indicator.upper() == "SMA":
-                data, metadata = self.ti.get_sma(symbol=symbol, interval='daily', time_period=20)
+                data, metadata = await asyncio.to_thread(self.ti.get_sma, symbol=symbol, interval='daily', time_period=20)
             elif indicator.upper() == "EMA":
-                data, metadata = self.ti.get_ema(symbol=symbol, interval='daily', time_period=20)
+                data, metadata = await asyncio.to_thread(self.ti.get_ema, symbol=symbol, interval='daily', time_period=20)
             else:
-                data, metadata = self.ti.get_rsi(symbol=symbol, interval='daily')
+                data, metadata = await asyncio.to_thread(self.ti.get_rsi, symbol=symbol, interval='daily')
 
             if data.empty:
-                return await self._get_fallback_indicators(symbol, indicator)
+                return self._get_fallback_indicators(symbol, indicator)
 
             # Convert to our format
             indicators_data = []
             for date, row in data.head(10).iterrows():
                 indicators_data.append({
                     'date': date.strftime('%Y-%m-%d'),
-                    'value': float(list(row.values())[0])
+                    'value': float(row.iloc[0])
                 })
 
-            return {
+            result = {
                 'symbol': symbol,
                 'indicator': indicator.upper(),
                 'data': indicators_data,
                 'metadata': metadata
             }
+            self._set_cached(cache_key, result)
+            return result
 
         except Exception as e:
-            print(f"Technical indicators error for {symbol}: {e}")
-            return await self._get_fallback_indicators(symbol, indicator)
+            logger.warning("Technical indicators error for %s, using fallback data: %s", symbol, e)
+            return self._get_fallback_indicators(symbol, indicator)
 
     async def get_company_fundamentals(self, symbol: str) -> Dict[str, Any]:
         """Get company fundamental data"""
+        cache_key = f"fundamentals:{symbol}"
+        cached = self._get_cached(cache_key, self.FUNDAMENTALS_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        return await self._single_flight(cache_key, lambda: self._fetch_company_fundamentals(symbol, cache_key))
+
+    async def _fetch_company_fundamentals(self, symbol: str, cache_key: str) -> Dict[str, Any]:
+        """Request the company overview, falling back to mock data"""
         await self._check_rate_limit()
 
         try:
             # Get company overview
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    'function': 'OVERVIEW',
-                    'symbol': symbol,
-                    'apikey': self.api_key
-                }
+            session = self._get_session()
+            params = {
+                'function': 'OVERVIEW',
+                'symbol': symbol,
+                'apikey': self.api_key
+            }
 
-                async with session.get(self.base_url, params=params) as response:
-                    data = await response.json()
-
-                    if 'Symbol' in data and data['Symbol']:
-                        return {
-                            'symbol': data.get('Symbol', symbol),
-                            'company_name': data.get('Name', 'Unknown'),
-                            'sector': data.get('Sector', 'Unknown'),
-                            'industry': data.get('Industry', 'Unknown'),
-                            'market_cap': data.get('MarketCapitalization', 'N/A'),
-                            'pe_ratio': data.get('PERatio', 'N/A'),
-                            'peg_ratio': data.get('PEGRatio', 'N/A'),
-                            'dividend_yield': data.get('DividendYield', 'N/A'),
-                            '52_week_high': data.get('52WeekHigh', 'N/A'),
-                            '52_week_low': data.get('52WeekLow', 'N/A'),
-                            'description': data.get('Description', 'No description available')[:200] + '...'
-                        }
-                    else:
-                        return await self._get_fallback_fundamentals(symbol)
+            async with session.get(self.base_url, params=params) as response:
+                data = await response.json()
+
+                if 'Symbol' in data and data['Symbol']:
+                    result = {
+                        'symbol': data.get('Symbol', symbol),
+                        'company_name': data.get('Name', 'Unknown'),
+                        'sector': data.get('Sector', 'Unknown'),
+                        'industry': data.get('Industry', 'Unknown'),
+                        'market_cap': data.get('MarketCapitalization', 'N/A'),
+                        'pe_ratio': data.get('PERatio', 'N/A'),
+                        'peg_ratio': data.get('PEGRatio', 'N/A'),
+                        'dividend_yield': data.get('DividendYield', 'N/A'),
+                        '52_week_high': data.get('52WeekHigh', 'N/A'),
+                        '52_week_low': data.get('52WeekLow', 'N/A'),
+                        'description': data.get('Description', 'No description available')[:200] + '...'
+                    }
+                    self._set_cached(cache_key, result)
+                    return result
+                else:
+                    return self._get_fallback_fundamentals(symbol)
 
         except Exception as e:
-            print(f"Fundamentals error for {symbol}: {e}")
-            return await self._get_fallback_fundamentals(symbol)
+            logger.warning("Fundamentals error for %s, using fallback data: %s", symbol, e)
+            return self._get_fallback_fundamentals(symbol)
 
     async def search_symbols(self, keywords: str) -> List[Dict[str, Any]]:
         """Search for symbols matching keywords"""
         await self._check_rate_limit()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    'function': 'SYMBOL_SEARCH',
-                    'keywords': keywords,
-                    'apikey': self.api_key
-                }
+            session = self._get_session()
+            params = {
+                'function': 'SYMBOL_SEARCH',
+                'keywords': keywords,
+                'apikey': self.api_key
+            }
 
-                async with session.get(self.base_url, params=params) as response:
-                    data = await response.json()
-
-                    results = []
-                    if 'bestMatches' in data:
-                        for match in data['bestMatches'][:10]:  # Limit to 10 results
-                            results.append({
-                                'symbol': match.get('1. symbol', ''),
-                                'name': match.get('2. name', ''),
-                                'type': match.get('3. type', ''),
-                                'region': match.get('4. region', ''),
-                                'market_open': match.get('5. marketOpen', ''),
-                                'market_close': match.get('6. marketClose', ''),
-                                'timezone': match.get('7. timezone', ''),
-                                'currency': match.get('8. currency', ''),
-                                'match_score': float(match.get('9. matchScore', 0))
-                            })
-
-                    return results
+            async with session.get(self.base_url, params=params) as response:
+                data = await response.json()
+
+                results = []
+                if 'bestMatches' in data:
+                    for match in data['bestMatches'][:10]:  # Limit to 10 results
+                        results.append({
+                            'symbol': match.get('1. symbol', ''),
+                            'name': match.get('2. name', ''),
+                            'type': match.get('3. type', ''),
+                            'region': match.get('4. region', ''),
+                            'market_open': match.get('5. marketOpen', ''),
+                            'market_close': match.get('6. marketClose', ''),
+                            'timezone': match.get('7. timezone', ''),
+                            'currency': match.get('8. currency', ''),
+                            'match_score': float(match.get('9. matchScore', 0))
+                        })
+
+                return results
 
         except Exception as e:
-            print(f"Symbol search error: {e}")
+            logger.warning("Symbol search error: %s", e)
             return []
 
     # Fallback methods using mock data
-    async def _get_fallback_quote(self, symbol: str) -> Dict[str, Any]:
-        """Fallback quote data when API fails"""
-        import random
+    @staticmethod
+    def _recent_dates(now: datetime, days: int) -> List[str]:
+        """ISO dates for the last ``days`` days, newest first"""
+        return pd.date_range(end=now, periods=days, freq='D')[::-1].strftime('%Y-%m-%d').tolist()
 
-        base_price = random.uniform(50, 500)
-        change = random.uniform(-10, 10)
+    def _get_fallback_quote(self, symbol: str) -> Dict[str, Any]:
+        """Fallback quote data when API fails"""
+        base_price = self._random.uniform(50, 500)
+        change = self._random.uniform(-10, 10)
 
         return {
             'symbol': symbol,
             'price': round(base_price, 2),
             'change': round(change, 2),
             'change_percent': f"{round((change/base_price)*100, 2)}",
-            'volume': random.randint(100000, 10000000),
+            'volume': self._random.randint(100000, 10000000),
             'latest_trading_day': datetime.now().strftime('%Y-%m-%d'),
             'previous_close': round(base_price - change, 2),
-            'open': round(base_price + random.uniform(-5, 5), 2),
-            'high': round(base_price + random.uniform(0, 10), 2),
-            'low': round(base_price - random.uniform(0, 10), 2),
+            'open': round(base_price + self._random.uniform(-5, 5), 2),
+            'high': round(base_price + self._random.uniform(0, 10), 2),
+            'low': round(base_price - self._random.uniform(0, 10), 2),
             'data_source': 'Fallback Mock Data'
         }
 
-    async def _get_fallback_historical(self, symbol: str, period: str) -> Dict[str, Any]:
+    def _get_fallback_historical(self, symbol: str, period: str) -> Dict[str, Any]:
         """Fallback historical data"""
-        import random
-        from datetime import datetime, timedelta
-
-        data = []
-        base_price = random.uniform(50, 500)
-
-        for i in range(30):
-            date = datetime.now() - timedelta(days=i)
-            daily_change = random.uniform(-0.05, 0.05)
-
-            open_price = base_price * (1 + daily_change)
-            high_price = open_price * (1 + random.uniform(0, 0.03))
-            low_price = open_price * (1 - random.uniform(0, 0.03))
-            close_price = open_price + random.uniform(-2, 2)
-
-            data.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'open': round(open_price, 2),
-                'high': round(high_price, 2),
-                'low': round(low_price, 2),
-                'close': round(close_price, 2),
-                'volume': random.randint(100000, 10000000)
-            })
-
-            base_price = close_price
+        n = self.HISTORICAL_ROWS
+        base_price = self._rng.uniform(50, 500)
+        now = datetime.now()
+
+        # Walking back from today, each open is the previous close moved by
+        # up to 5% and each close is the open plus up to 2 either way, i.e.
+        # close[i] = close[i-1] * growth[i] + noise[i]. The linear recurrence
+        # unrolls to cumulative products and sums, so no Python loop is needed.
+        growth = 1 + self._rng.uniform(-0.05, 0.05, n)
+        noise = self._rng.uniform(-2, 2, n)
+        compounded = np.cumprod(growth)
+        closes = compounded * (base_price + np.cumsum(noise / compounded))
+        opens = closes - noise
+        highs = opens * (1 + self._rng.uniform(0, 0.03, n))
+        lows = opens * (1 - self._rng.uniform(0, 0.03, n))
+        volumes = self._rng.integers(100000, 10000000, n, endpoint=True)
+
+        data = [
+            {
+                'date': date,
+                'open': o,
+                'high': h,
+                'low': l,
+                'close': c,
+                'volume': v
+            }
+            for date, o, h, l, c, v in zip(
+                self._recent_dates(now, n),
+                np.round(opens, 2).tolist(), np.round(highs, 2).tolist(),
+                np.round(lows, 2).tolist(), np.round(closes, 2).tolist(),
+                volumes.tolist()
+            )
+        ]
 
         return {
             'symbol': symbol,
@@ -296,30 +611,20 @@ class AlphaVantageClient:
             'data': data,
             'metadata': {
                 'data_source': 'Fallback Mock Data',
-                'last_refreshed': datetime.now().isoformat()
+                'last_refreshed': now.isoformat()
             }
         }
 
-    async def _get_fallback_indicators(self, symbol: str, indicator: str) -> Dict[str, Any]:
+    def _get_fallback_indicators(self, symbol: str, indicator: str) -> Dict[str, Any]:
         """Fallback technical indicators"""
-        import random
-        from datetime import datetime, timedelta
-
-        data = []
-        for i in range(10):
-            date = datetime.now() - timedelta(days=i)
+        low, high = FALLBACK_INDICATOR_RANGES.get(indicator.upper(), (50, 200))
 
-            if indicator.upper() == "RSI":
-                value = random.uniform(20, 80)
-            elif indicator.upper() == "MACD":
-                value = random.uniform(-2, 2)
-            else:
-                value = random.uniform(50, 200)
-
-            data.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'value': round(value, 4)
-            })
+        # One draw for the whole series instead of a random call per day
+        values = self._rng.uniform(low, high, 10)
+        data = [
+            {'date': date, 'value': value}
+            for date, value in zip(self._recent_dates(datetime.now(), 10), np.round(values, 4).tolist())
+        ]
 
         return {
             'symbol': symbol,
@@ -328,23 +633,19 @@ class AlphaVantageClient:
             'metadata': {'data_source': 'Fallback Mock Data'}
         }
 
-    async def _get_fallback_fundamentals(self, symbol: str) -> Dict[str, Any]:
+    def _get_fallback_fundamentals(self, symbol: str) -> Dict[str, Any]:
         """Fallback fundamental data"""
-        import random
-
-        sectors = ['Technology', 'Healthcare', 'Financial', 'Consumer', 'Industrial']
-
         return {
             'symbol': symbol,
             'company_name': f'{symbol} Corporation',
-            'sector': random.choice(sectors),
-            'industry': f'{random.choice(sectors)} Services',
-            'market_cap': f'{random.randint(1, 100)}B',
-            'pe_ratio': round(random.uniform(10, 30), 2),
-            'peg_ratio': round(random.uniform(0.5, 2.5), 2),
-            'dividend_yield': f'{round(random.uniform(0, 5), 2)}%',
-            '52_week_high': round(random.uniform(100, 200), 2),
-            '52_week_low': round(random.uniform(50, 99), 2),
+            'sector': self._random.choice(FALLBACK_SECTORS),
+            'industry': f'{self._random.choice(FALLBACK_SECTORS)} Services',
+            'market_cap': f'{self._random.randint(1, 100)}B',
+            'pe_ratio': round(self._random.uniform(10, 30), 2),
+            'peg_ratio': round(self._random.uniform(0.5, 2.5), 2),
+            'dividend_yield': f'{round(self._random.uniform(0, 5), 2)}%',
+            '52_week_high': round(self._random.uniform(100, 200), 2),
+            '52_week_low': round(self._random.uniform(50, 99), 2),
             'description': f'Fallback company description for {symbol}...',
             'data_source': 'Fallback Mock Data'
         }
\ No newline at end of file
@@ -5,9 +5,11 @@ Integrates all financial data APIs with intelligent fallback and caching
 """
 
 import os
+import time
 import asyncio
 import aiohttp
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Awaitable, Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
@@ -21,15 +23,56 @@ load_dotenv(dotenv_path)
 
 logger = logging.getLogger(__name__)
 
+# Market overview instruments: index ETFs as (result key, symbol) and CoinGecko coin ids
+OVERVIEW_INDICES = (
+    ("sp500", "SPY"),  # S&P 500 ETF
+    ("nasdaq", "QQQ"),  # NASDAQ ETF
+    ("dow", "DIA"),  # Dow Jones ETF
+)
+OVERVIEW_COINS = ("bitcoin", "ethereum")
+
+# Headline keywords for the lightweight news sentiment tag
+POSITIVE_KEYWORDS = ("surge", "gain", "profit", "growth", "rise", "bullish", "strong")
+NEGATIVE_KEYWORDS = ("fall", "loss", "decline", "crash", "bearish", "weak", "drop")
+
+
+def _classify_error(error: Exception) -> str:
+    """Categorize a provider failure for status reporting"""
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    if isinstance(error, aiohttp.ClientResponseError):
+        return f"http_{error.status}"
+    if isinstance(error, aiohttp.ClientError):
+        return "connection"
+    return "other"
+
+
+def _is_provider_outage(error: Exception) -> bool:
+    """True for failures of the provider itself (timeouts, rate limits, 5xx,
+    connection errors) rather than of the request, e.g. an unknown symbol"""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientError))
+
 
 class UnifiedAPIManager:
     """
     Unified manager for all financial APIs with intelligent routing and fallback
     """
 
+    # Seconds a failed provider is skipped before it is tried again
+    RETRY_AFTER = 60
+
+    # Seconds each kind of response is served from cache; quotes move quickly,
+    # FRED series are revised at most daily
+    QUOTE_CACHE_TTL = 15
+    NEWS_CACHE_TTL = 300
+    ECONOMIC_CACHE_TTL = 3600
+
     def __init__(self):
         """Initialize with all API keys from environment"""
-        self.api_keys = {
+        # Read once from the environment; read-only afterwards
+        self.api_keys = MappingProxyType({
             'finnhub': os.getenv('FINNHUB_API_KEY'),
             'alpha_vantage': os.getenv('ALPHA_VANTAGE_API_KEY'),
             'news_api': os.getenv('NEWS_API_KEY'),
@@ -37,27 +80,106 @@ class UnifiedAPIManager:
             'fred': os.getenv('FRED_API_KEY'),
             'opensanctions': os.getenv('OPENSANCTIONS_API_KEY'),
             'marketstack': os.getenv('MARKETSTACK_API_KEY'),
-        }
+        })
 
         self.session = None
         self.cache = {}
         self.cache_ttl = 300  # 5 minutes default
+        self.cache_max_entries = 1024
 
         # API status tracking
         self.api_status = {
-            api: {"available": True, "last_error": None, "rate_limit_reset": None}
+            api: {
+                "available": True,
+                "last_error": None,
+                "last_error_type": None,
+                "last_latency_ms": None,
+                "rate_limit_reset": None
+            }
             for api in self.api_keys.keys()
         }
+        self._retry_at: Dict[str, float] = {}
+        # Upstream fetches in progress, keyed like the cache
+        self._inflight: Dict[str, asyncio.Task] = {}
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        self.ensure_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
+        await self.close()
+
+    def ensure_session(self) -> aiohttp.ClientSession:
+        """Open the HTTP session if it is not open yet
+
+        Every provider shares this one pooled session, so connections and DNS
+        lookups are reused across vendors and requests.
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self.session
+
+    async def close(self) -> None:
+        """Close the HTTP session"""
         if self.session:
             await self.session.close()
+            self.session = None
+
+    def _get_cached(self, cache_key: str, ttl: int) -> Optional[Any]:
+        """Return a cached response younger than ttl seconds"""
+        if cache_key in self.cache:
+            cached_data, cached_time = self.cache[cache_key]
+            if datetime.now() - cached_time < timedelta(seconds=ttl):
+                return cached_data
+        return None
+
+    def _set_cached(self, cache_key: str, data: Any, cached_time: Optional[datetime] = None) -> None:
+        """Cache a response, evicting the oldest entry once the cache is full"""
+        self.cache.pop(cache_key, None)
+        if len(self.cache) >= self.cache_max_entries:
+            self.cache.pop(next(iter(self.cache)))
+        self.cache[cache_key] = (data, cached_time or datetime.now())
+
+    async def _single_flight(self, cache_key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Share one upstream fetch among concurrent cache misses for the same key"""
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = self._inflight[cache_key] = asyncio.create_task(fetch())
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # A cancelled caller must not cancel the fetch the other callers are awaiting
+        return await asyncio.shield(task)
+
+    def _is_available(self, api: str) -> bool:
+        """Check a provider, re-enabling it once its retry window has passed"""
+        status = self.api_status[api]
+        if not status["available"] and time.monotonic() >= self._retry_at.get(api, 0.0):
+            status["available"] = True
+        return status["available"]
+
+    async def _timed(self, api: str, coro):
+        """Await a provider call, recording its latency and the type of any failure"""
+        start = time.monotonic()
+        try:
+            return await coro
+        except Exception as e:
+            self.api_status[api]["last_error_type"] = _classify_error(e)
+            raise
+        finally:
+            self.api_status[api]["last_latency_ms"] = round((time.monotonic() - start) * 1000, 1)
+
+    def _mark_unavailable(self, api: str, error: Exception) -> None:
+        """Skip a failing provider for RETRY_AFTER seconds"""
+        self._retry_at[api] = time.monotonic() + self.RETRY_AFTER
+        self.api_status[api]["available"] = False
+        self.api_status[api]["last_error"] = str(error) or type(error).__name__
+        self.api_status[api]["rate_limit_reset"] = (
+            datetime.now() + timedelta(seconds=self.RETRY_AFTER)
+        ).isoformat()
 
     # ==================== Stock Data ====================
 
@@ -66,27 +188,44 @@ class UnifiedAPIManager:
         Get real-time stock quote with intelligent API selection
         Priority: Finnhub -> Alpha Vantage -> MarketStack
         """
+        cache_key = f"quote_{symbol}"
+        cached = self._get_cached(cache_key, self.QUOTE_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        result = await self._single_flight(cache_key, lambda: self._fetch_stock_quote(symbol))
+        if result:
+            self._set_cached(cache_key, result)
+        return result
+
+    async def _fetch_stock_quote(self, symbol: str) -> Optional[Dict]:
+        """Walk the provider fallback chain for a quote"""
         # Try Finnhub first
-        if self.api_status['finnhub']['available']:
+        if self._is_available('finnhub'):
             try:
-                return await self._get_finnhub_quote(symbol)
+                return await self._timed('finnhub', self._get_finnhub_quote(symbol))
             except Exception as e:
                 logger.warning(f"Finnhub failed: {e}")
-                self.api_status['finnhub']['available'] = False
+                if _is_provider_outage(e):
+                    self._mark_unavailable('finnhub', e)
 
         # Fallback to Alpha Vantage
-        if self.api_status['alpha_vantage']['available']:
+        if self._is_available('alpha_vantage'):
             try:
-                return await self._get_alpha_vantage_quote(symbol)
+                return await self._timed('alpha_vantage', self._get_alpha_vantage_quote(symbol))
             except Exception as e:
                 logger.warning(f"Alpha Vantage failed: {e}")
+                if _is_provider_outage(e):
+                    self._mark_unavailable('alpha_vantage', e)
 
         # Last resort: MarketStack
-        if self.api_status['marketstack']['available']:
+        if self._is_available('marketstack'):
             try:
-                return await self._get_marketstack_quote(symbol)
+                return await self._timed('marketstack', self._get_marketstack_quote(symbol))
             except Exception as e:
                 logger.error(f"All stock APIs failed for {symbol}")
+                if _is_provider_outage(e):
+                    self._mark_unavailable('marketstack', e)
 
         return None
 
@@ -183,15 +322,36 @@ class UnifiedAPIManager:
         Get cryptocurrency price from CoinGecko
         """
         cache_key = f"crypto_{coin_id}"
-        if cache_key in self.cache:
-            cached_data, cached_time = self.cache[cache_key]
-            if datetime.now() - cached_time < timedelta(seconds=self.cache_ttl):
-                return cached_data
+        cached = self._get_cached(cache_key, self.cache_ttl)
+        if cached is not None:
+            return cached
 
+        prices = await self._single_flight(cache_key, lambda: self._fetch_crypto_prices([coin_id]))
+        return prices[coin_id]
+
+    async def get_crypto_prices(self, coin_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Get prices for several coins; cache misses share one CoinGecko request
+        """
+        results = {
+            coin_id: self._get_cached(f"crypto_{coin_id}", self.cache_ttl)
+            for coin_id in coin_ids
+        }
+        missing = [coin_id for coin_id, cached in results.items() if cached is None]
+        if missing:
+            batch_key = "crypto_" + ",".join(missing)
+            results.update(
+                await self._single_flight(batch_key, lambda: self._fetch_crypto_prices(missing))
+            )
+        return results
+
+    async def _fetch_crypto_prices(self, coin_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Request CoinGecko prices for coin_ids in one call and cache each coin"""
+        results: Dict[str, Optional[Dict]] = dict.fromkeys(coin_ids)
         try:
             url = "https://api.coingecko.com/api/v3/simple/price"
             params = {
-                "ids": coin_id,
+                "ids": ",".join(coin_ids),
                 "vs_currencies": "usd",
                 "include_24hr_change": "true",
                 "include_24hr_vol": "true",
@@ -204,24 +364,32 @@ class UnifiedAPIManager:
             async with self.session.get(url, params=params, headers=headers) as response:
                 response.raise_for_status()
                 data = await response.json()
-
-                result = {
-                    "coin_id": coin_id,
-                    "price": data[coin_id]["usd"],
-                    "change_24h": data[coin_id].get("usd_24h_change", 0),
-                    "volume_24h": data[coin_id].get("usd_24h_vol", 0),
-                    "market_cap": data[coin_id].get("usd_market_cap", 0),
-                    "timestamp": datetime.now().isoformat(),
-                    "source": "coingecko"
-                }
-
-                # Cache result
-                self.cache[cache_key] = (result, datetime.now())
-                return result
+                now = datetime.now()
+
+                for coin_id in coin_ids:
+                    coin = data.get(coin_id)
+                    if coin is None or "usd" not in coin:
+                        logger.error(f"CoinGecko returned no price for {coin_id}")
+                        continue
+
+                    result = {
+                        "coin_id": coin_id,
+                        "price": coin["usd"],
+                        "change_24h": coin.get("usd_24h_change", 0),
+                        "volume_24h": coin.get("usd_24h_vol", 0),
+                        "market_cap": coin.get("usd_market_cap", 0),
+                        "timestamp": now.isoformat(),
+                        "source": "coingecko"
+                    }
+
+                    # Cache result
+                    self._set_cached(f"crypto_{coin_id}", result, now)
+                    results[coin_id] = result
 
         except Exception as e:
-            logger.error(f"CoinGecko failed for {coin_id}: {e}")
-            return None
+            logger.error(f"CoinGecko failed for {', '.join(coin_ids)}: {e}")
+
+        return results
 
     # ==================== News Data ====================
 
@@ -233,6 +401,22 @@ class UnifiedAPIManager:
         """
         Get financial news from News API
         """
+        cache_key = f"news_{query}_{page_size}"
+        cached = self._get_cached(cache_key, self.NEWS_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        return await self._single_flight(
+            cache_key, lambda: self._fetch_financial_news(query, page_size, cache_key)
+        )
+
+    async def _fetch_financial_news(
+        self,
+        query: str,
+        page_size: int,
+        cache_key: str
+    ) -> Optional[List[Dict]]:
+        """Request News API articles, tag their sentiment and cache them"""
         try:
             url = "https://newsapi.org/v2/everything"
             params = {
@@ -249,17 +433,20 @@ class UnifiedAPIManager:
                 if data.get("status") != "ok":
                     return None
 
-                articles = []
-                for article in data.get("articles", []):
-                    articles.append({
+                analyze = self._analyze_sentiment
+                articles = [
+                    {
                         "title": article.get("title"),
                         "description": article.get("description"),
                         "url": article.get("url"),
                         "source": article.get("source", {}).get("name"),
                         "published_at": article.get("publishedAt"),
-                        "sentiment": self._analyze_sentiment(article.get("title", "")),
-                    })
+                        "sentiment": analyze(article.get("title", "")),
+                    }
+                    for article in data.get("articles", [])
+                ]
 
+                self._set_cached(cache_key, articles)
                 return articles
 
         except Exception as e:
@@ -268,12 +455,9 @@ class UnifiedAPIManager:
 
     def _analyze_sentiment(self, text: str) -> str:
         """Simple sentiment analysis"""
-        positive_keywords = ["surge", "gain", "profit", "growth", "rise", "bullish", "strong"]
-        negative_keywords = ["fall", "loss", "decline", "crash", "bearish", "weak", "drop"]
-
         text_lower = text.lower()
-        positive_count = sum(1 for word in positive_keywords if word in text_lower)
-        negative_count = sum(1 for word in negative_keywords if word in text_lower)
+        positive_count = sum(1 for word in POSITIVE_KEYWORDS if word in text_lower)
+        negative_count = sum(1 for word in NEGATIVE_KEYWORDS if word in text_lower)
 
         if positive_count > negative_count:
             return "positive"
@@ -292,6 +476,22 @@ class UnifiedAPIManager:
         """
         Get economic indicators from FRED
         """
+        cache_key = f"economic_{series_id}_{limit}"
+        cached = self._get_cached(cache_key, self.ECONOMIC_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        return await self._single_flight(
+            cache_key, lambda: self._fetch_economic_indicator(series_id, limit, cache_key)
+        )
+
+    async def _fetch_economic_indicator(
+        self,
+        series_id: str,
+        limit: int,
+        cache_key: str
+    ) -> Optional[Dict]:
+        """Request FRED observations and cache them"""
         try:
             url = "https://api.stlouisfed.org/fred/series/observations"
             params = {
@@ -310,7 +510,7 @@ class UnifiedAPIManager:
                 if not observations:
                     return None
 
-                return {
+                result = {
                     "series_id": series_id,
                     "observations": [
                         {
@@ -323,6 +523,9 @@ class UnifiedAPIManager:
                     "source": "fred"
                 }
 
+                self._set_cached(cache_key, result)
+                return result
+
         except Exception as e:
             logger.error(f"FRED API failed: {e}")
             return None
@@ -373,37 +576,30 @@ class UnifiedAPIManager:
         Get comprehensive market overview
         """
         tasks = {
-            "spy": self.get_stock_quote("SPY"),  # S&P 500 ETF
-            "qqq": self.get_stock_quote("QQQ"),  # NASDAQ ETF
-            "dia": self.get_stock_quote("DIA"),  # Dow Jones ETF
-            "bitcoin": self.get_crypto_price("bitcoin"),
-            "ethereum": self.get_crypto_price("ethereum"),
+            **{key: self.get_stock_quote(symbol) for key, symbol in OVERVIEW_INDICES},
+            # CoinGecko prices several coins per request
+            "crypto": self.get_crypto_prices(list(OVERVIEW_COINS)),
             "news": self.get_financial_news("stock market", 5),
             "gdp": self.get_economic_indicator("GDP", 1),
         }
 
+        # The sources are independent, so fetch them concurrently
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
         results = {}
-        for key, task in tasks.items():
-            try:
-                results[key] = await task
-            except Exception as e:
-                logger.error(f"Failed to get {key}: {e}")
-                results[key] = None
+        for key, outcome in zip(tasks, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to get {key}: {outcome}")
+                outcome = None
+            results[key] = outcome
 
         return {
             "timestamp": datetime.now().isoformat(),
-            "indices": {
-                "sp500": results.get("spy"),
-                "nasdaq": results.get("qqq"),
-                "dow": results.get("dia"),
-            },
-            "crypto": {
-                "bitcoin": results.get("bitcoin"),
-                "ethereum": results.get("ethereum"),
-            },
-            "news": results.get("news"),
+            "indices": {key: results[key] for key, _ in OVERVIEW_INDICES},
+            "crypto": results["crypto"] or dict.fromkeys(OVERVIEW_COINS),
+            "news": results["news"],
             "economic": {
-                "gdp": results.get("gdp"),
+                "gdp": results["gdp"],
             }
         }
 
@@ -414,7 +610,7 @@ class UnifiedAPIManager:
         Get status of all APIs
         """
         return {
-            "apis": self.api_status,
+            "apis": {api: dict(status) for api, status in self.api_status.items()},
             "configured_keys": {
                 api: bool(key) for api, key in self.api_keys.items()
             },
@@ -422,6 +618,29 @@ class UnifiedAPIManager:
         }
 
 
+# ==================== Shared Instance ====================
+
+_shared_manager: Optional[UnifiedAPIManager] = None
+
+
+def get_shared_manager() -> UnifiedAPIManager:
+    """
+    Get the process-wide API manager so tools reuse one connection pool,
+    the crypto cache and provider status across requests
+    """
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = UnifiedAPIManager()
+    _shared_manager.ensure_session()
+    return _shared_manager
+
+
+async def close_shared_manager() -> None:
+    """Close the process-wide API manager's HTTP session"""
+    if _shared_manager is not None:
+        await _shared_manager.close()
+
+
 # ==================== Example Usage ====================
 
 async def main():
@@ -33,6 +33,7 @@ from shared.utils.consul_client import ConsulClient
 from shared.utils.health_check import HealthChecker
 from app.core.config import MarketSpokeConfig
 from app.services.hub_registration import HubRegistrationService
+from app.clients.unified_api_manager import close_shared_manager
 from app.tools.price_analyzer import PriceAnalyzer
 from app.tools.volatility_predictor import VolatilityPredictor
 from app.tools.sentiment_analyzer import SentimentAnalyzer
@@ -45,6 +46,7 @@ from app.tools.unified_market_data import (
     MarketOverviewTool,
     APIStatusTool
 )
+from shared.utils.serialization import dumps_result
 
 # Initialize logger
 logger = setup_logging("market-spoke")
@@ -83,10 +85,9 @@ TOOLS_REGISTRY = {
 }
 
 
-async def register_with_hub():
+async def register_with_hub(registration_service: HubRegistrationService):
     """Register this Market Spoke with the Hub"""
     try:
-        registration_service = HubRegistrationService()
         await registration_service.register()
         logger.info("Successfully registered with Hub")
     except Exception as e:
@@ -107,8 +108,10 @@ async def lifespan(app: FastAPI):
     )
     app.state.consul = consul_client
 
-    # Register with Hub
-    await register_with_hub()
+    # Register with Hub (the service keeps one pooled HTTP client for its lifetime)
+    registration_service = HubRegistrationService()
+    app.state.hub_registration = registration_service
+    await register_with_hub(registration_service)
 
     # Register health checks
     health_checker = HealthChecker("market-spoke", "1.0.0")
@@ -128,6 +131,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to deregister from Consul: {e}")
 
+    await registration_service.close()
+    await close_shared_manager()
+
 
 # FastAPI application
 app = FastAPI(
@@ -237,7 +243,7 @@ async def mcp_endpoint(request: Dict[str, Any]):
                 "result": {
                     "content": [{
                         "type": "text",
-                        "text": json.dumps(result, indent=2)
+                        "text": dumps_result(result)
                     }]
                 }
             }
@@ -4,12 +4,12 @@ Hub Registration Service - Auto-register Market Spoke with Hub
 import json
 import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Add shared directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 
-import aiohttp
+import httpx
 from shared.utils.logging import setup_logging
 from app.core.config import MarketSpokeConfig
 
@@ -22,31 +22,51 @@ class HubRegistrationService:
     def __init__(self):
         self.config = MarketSpokeConfig()
         self.hub_url = f"http://{self.config.hub_host}:{self.config.hub_port}"
+        self._client: Optional[httpx.AsyncClient] = None
+        self._service_info_bytes: Optional[bytes] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=300
+                ),
+                timeout=httpx.Timeout(30.0)
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def register(self) -> bool:
         """Register this Market Spoke service with the Hub"""
         try:
-            service_info = self._get_service_info()
-
-            async with aiohttp.ClientSession() as session:
-                # Register service with Hub
-                register_url = f"{self.hub_url}/api/v1/services/register"
-
-                async with session.post(
-                    register_url,
-                    json=service_info,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info(f"Successfully registered with Hub: {result}")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Hub registration failed: {response.status} - {error_text}")
-                        return False
-
-        except aiohttp.ClientError as e:
+            # Service info is static for the process lifetime; serialize it once
+            if self._service_info_bytes is None:
+                self._service_info_bytes = json.dumps(self._get_service_info()).encode()
+
+            register_url = f"{self.hub_url}/api/v1/services/register"
+            response = await self._get_client().post(
+                register_url,
+                content=self._service_info_bytes,
+                headers={"Content-Type": "application/json"}
+            )
+            if response.status_code == 200:
+                result = response.json()
+                logger.info(f"Successfully registered with Hub: {result}")
+                return True
+            else:
+                logger.error(f"Hub registration failed: {response.status_code} - {response.text}")
+                return False
+
+        except httpx.HTTPError as e:
             logger.error(f"Network error during Hub registration: {e}")
             return False
         except Exception as e:
@@ -95,22 +115,16 @@ class HubRegistrationService:
     async def deregister(self) -> bool:
         """Deregister this service from the Hub"""
         try:
-            async with aiohttp.ClientSession() as session:
-                deregister_url = f"{self.hub_url}/api/v1/services/{self.config.service_name}"
-
-                async with session.delete(
-                    deregister_url,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status in [200, 204, 404]:  # 404 is OK (already deregistered)
-                        logger.info("Successfully deregistered from Hub")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Hub deregistration failed: {response.status} - {error_text}")
-                        return False
-
-        except aiohttp.ClientError as e:
+            deregister_url = f"{self.hub_url}/api/v1/services/{self.config.service_name}"
+            response = await self._get_client().delete(deregister_url)
+            if response.status_code in [200, 204, 404]:  # 404 is OK (already deregistered)
+                logger.info("Successfully deregistered from Hub")
+                return True
+            else:
+                logger.error(f"Hub deregistration failed: {response.status_code} - {response.text}")
+                return False
+
+        except httpx.HTTPError as e:
             logger.error(f"Network error during Hub deregistration: {e}")
             return False
         except Exception as e:
@@ -131,19 +145,13 @@ class HubRegistrationService:
                 }
             }
 
-            async with aiohttp.ClientSession() as session:
-                health_url = f"{self.hub_url}/api/v1/services/{self.config.service_name}/health"
-
-                async with session.put(
-                    health_url,
-                    json=health_info,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        return True
-                    else:
-                        logger.warning(f"Health status update failed: {response.status}")
-                        return False
+            health_url = f"{self.hub_url}/api/v1/services/{self.config.service_name}/health"
+            response = await self._get_client().put(health_url, json=health_info, timeout=10.0)
+            if response.status_code == 200:
+                return True
+            else:
+                logger.warning(f"Health status update failed: {response.status_code}")
+                return False
 
         except Exception as e:
             logger.warning(f"Failed to update health status: {e}")
@@ -5,9 +5,12 @@ Configurable alerts for various market conditions
 
 import sys
 import asyncio
+import itertools
+from collections import Counter
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from pathlib import Path
+from app.utils.symbols import is_valid_symbol
 import pandas as pd
 
 
@@ -17,6 +20,16 @@ class AlertSystemTool:
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent.parent.parent.parent / 'data' / 'stock-data'
 
+        # Alert type -> check method; all checks share the (df, thresholds, as_of) signature
+        self._CHECKS = {
+            "price_target": self._check_price_target_alert,
+            "percent_change": self._check_percent_change_alert,
+            "volume_spike": self._check_volume_spike_alert,
+            "breakout": self._check_breakout_alert,
+            "support_resistance": self._check_support_resistance_alert,
+            "volatility": self._check_volatility_alert,
+        }
+
     async def get_tool_info(self) -> Dict:
         """Get tool information for MCP protocol"""
         return {
@@ -73,10 +86,10 @@ class AlertSystemTool:
             print(f"Error loading data for {symbol}: {e}", file=sys.stderr)
             return None
 
-    def _check_price_target_alert(self, df: pd.DataFrame, thresholds: Dict) -> List[Dict]:
+    def _check_price_target_alert(self, df: pd.DataFrame, thresholds: Dict, as_of: str) -> List[Dict]:
         """Check if price has crossed target levels"""
         alerts = []
-        current_price = float(df.iloc[-1]['Close'])
+        current_price = float(df['Close'].iat[-1])
 
         price_above = thresholds.get('price_above')
         price_below = thresholds.get('price_below')
@@ -88,7 +101,7 @@ class AlertSystemTool:
                 "message": f"Price {current_price:.2f} reached or exceeded target {price_above:.2f}",
                 "current_price": current_price,
                 "target_price": price_above,
-                "timestamp": df.iloc[-1]['Date'].strftime('%Y-%m-%d')
+                "timestamp": as_of
             })
 
         if price_below and current_price <= price_below:
@@ -98,12 +111,12 @@ class AlertSystemTool:
                 "message": f"Price {current_price:.2f} fell to or below target {price_below:.2f}",
                 "current_price": current_price,
                 "target_price": price_below,
-                "timestamp": df.iloc[-1]['Date'].strftime('%Y-%m-%d')
+                "timestamp": as_of
             })
 
         return alerts
 
-    def _check_percent_change_alert(self, df: pd.DataFrame, thresholds: Dict) -> List[Dict]:
+    def _check_percent_change_alert(self, df: pd.DataFrame, thresholds: Dict, as_of: str) -> List[Dict]:
         """Check for significant percentage changes"""
         alerts = []
 
@@ -111,13 +124,13 @@ class AlertSystemTool:
             return alerts
 
         # Daily change
-        current_price = float(df.iloc[-1]['Close'])
-        prev_price = float(df.iloc[-2]['Close'])
+        current_price = float(df['Close'].iat[-1])
+        prev_price = float(df['Close'].iat[-2])
         daily_change_pct = ((current_price - prev_price) / prev_price) * 100
 
         # Weekly change (5 trading days)
         if len(df) >= 5:
-            week_ago_price = float(df.iloc[-5]['Close'])
+            week_ago_price = float(df['Close'].iat[-5])
             weekly_change_pct = ((current_price - week_ago_price) / week_ago_price) * 100
         else:
             weekly_change_pct = 0
@@ -134,7 +147,7 @@ class AlertSystemTool:
                 "message": f"Daily change of {daily_change_pct:.2f}% exceeds threshold {threshold}%",
                 "change_pct": daily_change_pct,
                 "threshold": threshold,
-                "timestamp": df.iloc[-1]['Date'].strftime('%Y-%m-%d')
+                "timestamp": as_of
             })
 
         if abs(weekly_change_pct) >= threshold * 2:
@@ -145,19 +158,19 @@ class AlertSystemTool:
                 "severity": "MEDIUM",
                 "message": f"Weekly change of {weekly_change_pct:.2f}% is significant",
                 "change_pct": weekly_change_pct,
-                "timestamp": df.iloc[-1]['Date'].strftime('%Y-%m-%d')
+                "timestamp": as_of
             })
 
         return alerts
 
-    def _check_volume_spike_alert(self, df: pd.DataFrame, thresholds: Dict) -> List[Dict]:
+    def _check_volume_spike_alert(self, df: pd.DataFrame, thresholds: Dict, as_of: str) -> List[Dict]:
         """Check for unusual volume spikes"""
         alerts = []
 
         if 'Volume' not in df.columns or len(df) < 20:
             return alerts
 
-        current_volume = int(df.iloc[-1]['Volume'])
+        current_volume = int(df['Volume'].iat[-1])
         avg_volume = int(df['Volume'].tail(20).mean())
 
         threshold_multiplier = thresholds.get('volume_multiplier', 2.0)
@@ -172,12 +185,12 @@ class AlertSystemTool:
                 "current_volume": current_volume,
                 "avg_volume": avg_volume,
                 "multiplier": float(current_volume / avg_volume),
-                "timestamp": df.iloc[-1]['Date'].strftime('%Y-%m-%d')
+                "timestamp": as_of
             })
 
         return alerts
 
-    def _check_breakout_alert(self, df: pd.DataFrame) -> List[Dict]:
+    def _check_breakout_alert(self, df: pd.DataFrame, thresholds: Dict, as_of: str) -> List[Dict]:
         """Check for price breakouts from recent range"""
         alerts = []
 
@@ -189,7 +202,7 @@ class AlertSystemTool:
         range_high = float(recent_data['High'].max())
         range_low = float(recent_data['Low'].min())
 
-        current_price = float(df.iloc[-1]['Close'])
+        current_price = float(df['Close'].iat[-1])
 
         # Check for upside breakout
         if current_price > range_high * 1.01:  # 1% above range high
@@ -202,7 +215,7 @@ class AlertSystemTool:
                 "current_price": current_price,
                 "breakout_level": range_high,
                 "pct_above": pct_above,
-                "timestamp": df.iloc[-1]['Date'].strftime('%Y-%m-%d')
+                "timestamp": as_of
             })
 
         # Check for downside breakdown
@@ -216,12 +229,12 @@ class AlertSystemTool:
                 "current_price": current_price,
                 "breakout_level": range_low,
                 "pct_below": pct_below,
-                "timestamp": df.iloc[-1]['Date'].strftime('%Y-%m-%d')
+                "timestamp": as_of
             })
 
         return alerts
 
-    def _check_support_resistance_alert(self, df: pd.DataFrame) -> List[Dict]:
+    def _check_support_resistance_alert(self, df: pd.DataFrame, thresholds: Dict, as_of: str) -> List[Dict]:
         """Check if price is near support or resistance levels"""
         alerts = []
 
@@ -233,7 +246,7 @@ class AlertSystemTool:
         resistance_level = float(recent_data['High'].max())
         support_level = float(recent_data['Low'].min())
 
-        current_price = float(df.iloc[-1]['Close'])
+        current_price = float(df['Close'].iat[-1])
 
         # Check proximity to resistance (within 2%)
         if resistance_level * 0.98 <= current_price <= resistance_level:
@@ -244,7 +257,7 @@ class AlertSystemTool:
                 "current_price": current_price,
                 "resistance_level": resistance_level,
                 "distance_pct": ((resistance_level - current_price) / current_price) * 100,
-                "timestamp": df.iloc[-1]['Date'].strftime('%Y-%m-%d')
+                "timestamp": as_of
             })
 
         # Check proximity to support (within 2%)
@@ -256,12 +269,12 @@ class AlertSystemTool:
                 "current_price": current_price,
                 "support_level": support_level,
                 "distance_pct": ((current_price - support_level) / current_price) * 100,
-                "timestamp": df.iloc[-1]['Date'].strftime('%Y-%m-%d')
+                "timestamp": as_of
             })
 
         return alerts
 
-    def _check_volatility_alert(self, df: pd.DataFrame, thresholds: Dict) -> List[Dict]:
+    def _check_volatility_alert(self, df: pd.DataFrame, thresholds: Dict, as_of: str) -> List[Dict]:
         """Check for unusual volatility"""
         alerts = []
 
@@ -293,7 +306,7 @@ class AlertSystemTool:
                 "current_volatility": current_vol,
                 "avg_volatility": avg_vol,
                 "multiplier": float(current_vol / avg_vol),
-                "timestamp": df.iloc[-1]['Date'].strftime('%Y-%m-%d')
+                "timestamp": as_of
             })
 
         return alerts
@@ -307,6 +320,19 @@ class AlertSystemTool:
         if not symbol:
             return {"error": "Symbol is required"}
 
+        if not is_valid_symbol(symbol):
+            return {"error": f"Invalid symbol: {symbol}"}
+
+        if alert_type == "all":
+            checks = self._CHECKS.values()
+        elif alert_type in self._CHECKS:
+            checks = [self._CHECKS[alert_type]]
+        else:
+            return {
+                "error": f"Unknown alert_type: {alert_type}",
+                "valid_types": list(self._CHECKS) + ["all"]
+            }
+
         # Load stock data
         df = self._load_stock_data(symbol)
         if df is None:
@@ -324,39 +350,24 @@ class AlertSystemTool:
                 "available_days": len(df_recent)
             }
 
-        # Collect all alerts
-        all_alerts = []
-
-        # Check alerts based on type
-        if alert_type == "all" or alert_type == "price_target":
-            all_alerts.extend(self._check_price_target_alert(df_recent, thresholds))
+        # Format the as-of date once; every alert is stamped with it
+        last_updated = df_recent['Date'].iat[-1].strftime('%Y-%m-%d')
 
-        if alert_type == "all" or alert_type == "percent_change":
-            all_alerts.extend(self._check_percent_change_alert(df_recent, thresholds))
+        # Checks only read df_recent, so run them side by side off the event loop
+        results = await asyncio.gather(
+            *(asyncio.to_thread(check, df_recent, thresholds, last_updated) for check in checks)
+        )
+        all_alerts = list(itertools.chain.from_iterable(results))
 
-        if alert_type == "all" or alert_type == "volume_spike":
-            all_alerts.extend(self._check_volume_spike_alert(df_recent, thresholds))
-
-        if alert_type == "all" or alert_type == "breakout":
-            all_alerts.extend(self._check_breakout_alert(df_recent))
-
-        if alert_type == "all" or alert_type == "support_resistance":
-            all_alerts.extend(self._check_support_resistance_alert(df_recent))
-
-        if alert_type == "all" or alert_type == "volatility":
-            all_alerts.extend(self._check_volatility_alert(df_recent, thresholds))
-
-        # Get latest price info
-        latest = df_recent.iloc[-1]
-
-        # Count alerts by severity
-        high_severity = sum(1 for a in all_alerts if a.get('severity') == 'HIGH')
-        medium_severity = sum(1 for a in all_alerts if a.get('severity') == 'MEDIUM')
+        # Count alerts by severity in a single pass
+        severity_counts = Counter(a.get('severity') for a in all_alerts)
+        high_severity = severity_counts['HIGH']
+        medium_severity = severity_counts['MEDIUM']
 
         return {
             "symbol": symbol,
-            "current_price": float(latest['Close']),
-            "last_updated": latest['Date'].strftime('%Y-%m-%d'),
+            "current_price": float(df_recent['Close'].iat[-1]),
+            "last_updated": last_updated,
             "alert_type": alert_type,
             "thresholds": thresholds,
             "alerts": {
@@ -375,23 +386,16 @@ class AlertSystemTool:
         if not alerts:
             return f"{symbol}: No alerts triggered"
 
-        summary_parts = []
-        summary_parts.append(f"{symbol}: {len(alerts)} alert(s)")
-
-        if high_count > 0:
-            summary_parts.append(f"{high_count} HIGH severity")
-        if medium_count > 0:
-            summary_parts.append(f"{medium_count} MEDIUM severity")
-
-        # Add most critical alert
-        high_alerts = [a for a in alerts if a.get('severity') == 'HIGH']
-        if high_alerts:
-            critical = high_alerts[0]
-            summary_parts.append(f"⚠️ {critical['type']}: {critical['message']}")
-        elif alerts:
-            summary_parts.append(f"ℹ️ {alerts[0]['type']}")
+        # Most critical alert: first HIGH one, otherwise just name the first alert
+        critical = next((a for a in alerts if a.get('severity') == 'HIGH'), None) if high_count else None
 
-        return " | ".join(summary_parts)
+        return (
+            f"{symbol}: {len(alerts)} alert(s)"
+            + (f" | {high_count} HIGH severity" if high_count else "")
+            + (f" | {medium_count} MEDIUM severity" if medium_count else "")
+            + (f" | ⚠️ {critical['type']}: {critical['message']}" if critical
+               else f" | ℹ️ {alerts[0]['type']}")
+        )
 
 
 # Export for MCP server
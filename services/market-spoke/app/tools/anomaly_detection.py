@@ -4,16 +4,129 @@ Uses Z-Score, IQR, and statistical methods to detect unusual price/volume behavi
 """
 
 import sys
+import itertools
+from functools import lru_cache
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-from scipy import stats
+from types import MappingProxyType
+from app.utils.jit import njit, warmup
+from app.utils.rolling import rolling_max, rolling_min, rolling_std
+from app.utils.symbols import is_valid_symbol
+
+# Price columns fit comfortably in float32; halving the element size halves the
+# bytes every rolling/pct_change pass touches. Volume stays 64-bit (1e9+ days exist).
+CSV_DTYPES = {
+    'Open': 'float32',
+    'High': 'float32',
+    'Low': 'float32',
+    'Close': 'float32',
+    'Adj Close': 'float32',
+    'Volume': 'int64'
+}
+
+# Z-score threshold per sensitivity level
+SENSITIVITY_THRESHOLDS = MappingProxyType({
+    "low": 3.0,      # 99.7% of data within range
+    "medium": 2.5,   # 98.8% of data within range
+    "high": 2.0      # 95.4% of data within range
+})
+
+
+def _zscore_stats(a: np.ndarray) -> Tuple[float, float, np.ndarray]:
+    """(mean, std, |z|) from one reduction; population std like scipy.stats.zscore
+
+    NaN inputs are skipped and stay NaN in the z array.
+    """
+    out = np.full(a.shape, np.nan, dtype=np.float32)
+    valid = ~np.isnan(a)
+    if not valid.any():
+        return float('nan'), float('nan'), out
+
+    v = a[valid].astype(np.float64)
+    m = v.mean()
+    s = v.std()
+    # A flat series has no outliers; report zeros instead of 0/0 NaNs
+    out[valid] = np.abs((v - m) / s) if s > 0 else 0.0
+    return float(m), float(s), out
+
+
+def _abs_zscore(a: np.ndarray) -> np.ndarray:
+    """Absolute Z-Score (population std, like scipy.stats.zscore); NaN inputs stay NaN"""
+    return _zscore_stats(a)[2]
+
+
+@njit(cache=True)
+def _find_breakouts(close: np.ndarray, upper_prev: np.ndarray, lower_prev: np.ndarray):
+    """Indices and signed percentages of closes more than 1% outside the prior range"""
+    n = close.shape[0]
+    idx = np.empty(n, np.int64)
+    pct = np.empty(n, np.float64)
+    k = 0
+    for i in range(n):
+        upper = upper_prev[i]
+        lower = lower_prev[i]
+        if upper != upper or lower != lower:  # NaN: range not established yet
+            continue
+        c = close[i]
+        if c > upper:
+            p = (c - upper) / upper * 100.0
+            if p > 1.0:
+                idx[k] = i
+                pct[k] = p
+                k += 1
+        elif c < lower:
+            p = (lower - c) / lower * 100.0
+            if p > 1.0:
+                idx[k] = i
+                pct[k] = -p
+                k += 1
+    return idx[:k], pct[:k]
+
+
+def _top_k(scores: np.ndarray, k: int = 10) -> np.ndarray:
+    """Positions of the k largest scores, largest first (O(n) selection, then sort k)"""
+    k = min(k, scores.size)
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
+def _count_data_rows(path_str: str) -> int:
+    """Count CSV data rows (lines minus header) without parsing them"""
+    with open(path_str, 'rb') as f:
+        lines = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 16), b''))
+    return max(0, lines - 1)
+
+
+@lru_cache(maxsize=128)
+def _load_csv_cached(path_str: str, mtime: float, tail_rows: Optional[int] = None) -> pd.DataFrame:
+    """Parse a stock CSV; keyed on mtime so an updated file is re-read.
+
+    With ``tail_rows`` only the last rows of the file are parsed; the CSVs are
+    written oldest-first, so these are the most recent sessions. The returned
+    frame is shared between calls and must not be mutated.
+    """
+    skiprows = None
+    if tail_rows is not None:
+        skip = _count_data_rows(path_str) - tail_rows
+        if skip > 0:
+            skiprows = range(1, skip + 1)  # keep the header line
+
+    df = pd.read_csv(path_str, dtype=CSV_DTYPES, skiprows=skiprows)
+    # Rows carry mixed DST offsets; normalize to UTC so Date is a datetime64 column
+    df['Date'] = pd.to_datetime(df['Date'], utc=True)
+    return df.sort_values('Date', kind='mergesort', ignore_index=True)
 
 
 class AnomalyDetectionTool:
     """Detect anomalies in price and volume data using statistical methods"""
 
+    MIN_ROWS = 30        # minimum history for meaningful z-scores
+    RANGE_WINDOW = 20    # rolling window for volatility and trading range
+
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent.parent.parent.parent / 'data' / 'stock-data'
 
@@ -45,183 +158,237 @@ class AnomalyDetectionTool:
             }
         }
 
-    def _load_stock_data(self, symbol: str) -> Optional[pd.DataFrame]:
-        """Load stock data from CSV file"""
+    def _load_stock_data(self, symbol: str, tail_rows: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """Load stock data from CSV file (only the last ``tail_rows`` rows if given)"""
         try:
             file_path = self.data_dir / f"{symbol.upper()}.csv"
             if not file_path.exists():
                 return None
 
-            df = pd.read_csv(file_path)
-            df['Date'] = pd.to_datetime(df['Date'])
-            df = df.sort_values('Date')
-            return df
+            return _load_csv_cached(str(file_path), file_path.stat().st_mtime, tail_rows)
         except Exception as e:
             print(f"Error loading data for {symbol}: {e}", file=sys.stderr)
             return None
 
     def _get_threshold(self, sensitivity: str) -> float:
         """Get Z-score threshold based on sensitivity"""
-        thresholds = {
-            "low": 3.0,      # 99.7% of data within range
-            "medium": 2.5,   # 98.8% of data within range
-            "high": 2.0      # 95.4% of data within range
-        }
-        return thresholds.get(sensitivity, 2.5)
-
-    def _detect_price_anomalies_zscore(self, df: pd.DataFrame, threshold: float) -> List[Dict]:
+        return SENSITIVITY_THRESHOLDS.get(sensitivity, 2.5)
+
+    def _prepare(self, df: pd.DataFrame, window: int = RANGE_WINDOW) -> pd.DataFrame:
+        """Compute every derived column the detectors need, once per request
+
+        Columns whose inputs are missing, or whose rolling window does not fit
+        the data, are left out; the matching detectors then return early.
+        """
+        out = df.reset_index(drop=True)  # fresh frame; the caller's data is left untouched
+        close = out['Close']
+        prev_close = close.shift(1)
+
+        # ISO day strings for every row in one C-level pass, reused by all detectors
+        out['DateStr'] = np.datetime_as_string(out['Date'].to_numpy(dtype='datetime64[ns]'), unit='D')
+
+        out['Returns'] = close.pct_change()
+        out['Price_Change_Pct'] = out['Returns'] * 100
+        out['Z_Score'] = _abs_zscore(out['Price_Change_Pct'].to_numpy())
+
+        if 'Volume' in out.columns:
+            # The volume detector reports the mean too; share it with the z-score pass
+            avg_volume, _, out['Volume_Z_Score'] = _zscore_stats(out['Volume'].to_numpy())
+            out.attrs['avg_volume'] = avg_volume
+
+        # Rolling detectors need at least one full window plus a bar to compare against
+        has_window = len(out) >= window + 2
+
+        if has_window:
+            annualize = np.float32(np.sqrt(252) * 100)
+            out['Volatility'] = rolling_std(out['Returns'].to_numpy(dtype=np.float64), window) * annualize
+            out['Vol_Z_Score'] = _abs_zscore(out['Volatility'].to_numpy())
+
+        if 'Open' in out.columns:
+            out['Prev_Close'] = prev_close
+            out['Gap'] = ((out['Open'] - prev_close) / prev_close) * 100
+
+        if has_window and 'High' in out.columns and 'Low' in out.columns:
+            out['Upper_Range'] = rolling_max(out['High'].to_numpy(dtype=np.float32), window)
+            out['Lower_Range'] = rolling_min(out['Low'].to_numpy(dtype=np.float32), window)
+        return out
+
+    @staticmethod
+    def _severity_counts(is_high: np.ndarray) -> Tuple[int, int]:
+        """(HIGH, MEDIUM) counts for a detector's kept anomalies"""
+        high = int(np.count_nonzero(is_high))
+        return high, int(is_high.size) - high
+
+    def _detect_price_anomalies_zscore(self, df: pd.DataFrame, threshold: float) -> Tuple[List[Dict], int, int]:
         """Detect price anomalies using Z-Score method"""
-        df = df.copy()  # Create copy to avoid SettingWithCopyWarning
-        df['Price_Change_Pct'] = df['Close'].pct_change() * 100
-
-        # Calculate Z-Score only on non-null values
-        price_changes = df['Price_Change_Pct'].dropna()
-        if len(price_changes) > 0:
-            z_scores = np.abs(stats.zscore(price_changes))
-            # Create a Series with proper index alignment
-            df.loc[price_changes.index, 'Z_Score'] = z_scores
-        else:
-            df['Z_Score'] = np.nan
-
-        anomalies = []
-        for idx, row in df.iterrows():
-            if pd.notna(row['Z_Score']) and row['Z_Score'] > threshold:
-                anomalies.append({
-                    "date": row['Date'].strftime('%Y-%m-%d'),
-                    "price": float(row['Close']),
-                    "change_pct": float(row['Price_Change_Pct']),
-                    "z_score": float(row['Z_Score']),
-                    "severity": "HIGH" if row['Z_Score'] > threshold + 1 else "MEDIUM",
-                    "type": "SPIKE" if row['Price_Change_Pct'] > 0 else "DROP"
-                })
-
-        return sorted(anomalies, key=lambda x: abs(x['z_score']), reverse=True)[:10]
-
-    def _detect_volume_anomalies(self, df: pd.DataFrame, threshold: float) -> List[Dict]:
+        if len(df) < self.MIN_ROWS:
+            return [], 0, 0
+
+        # Candidate rows from one mask (NaN z-scores compare False), keep the 10 largest
+        z = df['Z_Score'].to_numpy(dtype=float)
+        pos = np.flatnonzero(z > threshold)
+        pos = pos[_top_k(z[pos])]
+
+        hits = df.iloc[pos]
+        z_hit = z[pos]
+        change_hit = hits['Price_Change_Pct'].to_numpy(dtype=float)
+        is_high = z_hit > threshold + 1
+
+        anomalies = [
+            {
+                "date": date,
+                "price": price,
+                "change_pct": change,
+                "z_score": z,
+                "severity": severity,
+                "type": kind
+            }
+            for date, price, change, z, severity, kind in zip(
+                hits['DateStr'].tolist(),
+                hits['Close'].to_numpy(dtype=float).tolist(),
+                change_hit.tolist(),
+                z_hit.tolist(),
+                np.where(is_high, 'HIGH', 'MEDIUM').tolist(),
+                np.where(change_hit > 0, 'SPIKE', 'DROP').tolist()
+            )
+        ]
+        return anomalies, *self._severity_counts(is_high)
+
+    def _detect_volume_anomalies(self, df: pd.DataFrame, threshold: float) -> Tuple[List[Dict], int, int]:
         """Detect volume anomalies"""
-        if 'Volume' not in df.columns:
-            return []
-
-        df = df.copy()
-        volumes = df['Volume'].dropna()
-        if len(volumes) > 0:
-            z_scores = np.abs(stats.zscore(volumes))
-            df.loc[volumes.index, 'Volume_Z_Score'] = z_scores
-        else:
-            df['Volume_Z_Score'] = np.nan
-
-        anomalies = []
-        for idx, row in df.iterrows():
-            if pd.notna(row['Volume_Z_Score']) and row['Volume_Z_Score'] > threshold:
-                # Calculate average volume
-                avg_volume = df['Volume'].mean()
-
-                anomalies.append({
-                    "date": row['Date'].strftime('%Y-%m-%d'),
-                    "volume": int(row['Volume']),
-                    "avg_volume": int(avg_volume),
-                    "volume_ratio": float(row['Volume'] / avg_volume),
-                    "z_score": float(row['Volume_Z_Score']),
-                    "severity": "HIGH" if row['Volume_Z_Score'] > threshold + 1 else "MEDIUM"
-                })
-
-        return sorted(anomalies, key=lambda x: x['z_score'], reverse=True)[:10]
-
-    def _detect_volatility_anomalies(self, df: pd.DataFrame, window: int = 20) -> List[Dict]:
+        if 'Volume_Z_Score' not in df.columns or len(df) < self.MIN_ROWS:
+            return [], 0, 0
+
+        avg_volume = df.attrs['avg_volume']
+
+        z = df['Volume_Z_Score'].to_numpy(dtype=float)
+        pos = np.flatnonzero(z > threshold)
+        pos = pos[_top_k(z[pos])]
+
+        hits = df.iloc[pos]
+        volume_hit = hits['Volume'].to_numpy(dtype=float)
+        z_hit = z[pos]
+        is_high = z_hit > threshold + 1
+
+        anomalies = [
+            {
+                "date": date,
+                "volume": int(volume),
+                "avg_volume": int(avg_volume),
+                "volume_ratio": ratio,
+                "z_score": z,
+                "severity": severity
+            }
+            for date, volume, ratio, z, severity in zip(
+                hits['DateStr'].tolist(),
+                volume_hit.tolist(),
+                (volume_hit / avg_volume).tolist(),
+                z_hit.tolist(),
+                np.where(is_high, 'HIGH', 'MEDIUM').tolist()
+            )
+        ]
+        return anomalies, *self._severity_counts(is_high)
+
+    def _detect_volatility_anomalies(self, df: pd.DataFrame) -> Tuple[List[Dict], int, int]:
         """Detect unusual volatility periods"""
-        df = df.copy()
-        df['Returns'] = df['Close'].pct_change()
-        df['Volatility'] = df['Returns'].rolling(window=window).std() * np.sqrt(252) * 100
-
-        # Z-score of volatility
-        volatilities = df['Volatility'].dropna()
-        if len(volatilities) > 0:
-            z_scores = np.abs(stats.zscore(volatilities))
-            df.loc[volatilities.index, 'Vol_Z_Score'] = z_scores
-        else:
-            df['Vol_Z_Score'] = np.nan
-
-        anomalies = []
-        avg_volatility = df['Volatility'].mean()
-
-        for idx, row in df.iterrows():
-            if pd.notna(row['Vol_Z_Score']) and row['Vol_Z_Score'] > 2.0:
-                anomalies.append({
-                    "date": row['Date'].strftime('%Y-%m-%d'),
-                    "volatility": float(row['Volatility']),
-                    "avg_volatility": float(avg_volatility),
-                    "z_score": float(row['Vol_Z_Score']),
-                    "severity": "HIGH" if row['Volatility'] > avg_volatility * 2 else "MEDIUM"
-                })
-
-        return sorted(anomalies, key=lambda x: x['z_score'], reverse=True)[:10]
-
-    def _detect_gap_anomalies(self, df: pd.DataFrame) -> List[Dict]:
+        if 'Volatility' not in df.columns:
+            return [], 0, 0
+
+        avg_volatility = float(df['Volatility'].mean())
+
+        z = df['Vol_Z_Score'].to_numpy(dtype=float)
+        pos = np.flatnonzero(z > 2.0)
+        pos = pos[_top_k(z[pos])]
+
+        hits = df.iloc[pos]
+        vol_hit = hits['Volatility'].to_numpy(dtype=float)
+        is_high = vol_hit > avg_volatility * 2
+
+        anomalies = [
+            {
+                "date": date,
+                "volatility": vol,
+                "avg_volatility": avg_volatility,
+                "z_score": z,
+                "severity": severity
+            }
+            for date, vol, z, severity in zip(
+                hits['DateStr'].tolist(),
+                vol_hit.tolist(),
+                z[pos].tolist(),
+                np.where(is_high, 'HIGH', 'MEDIUM').tolist()
+            )
+        ]
+        return anomalies, *self._severity_counts(is_high)
+
+    def _detect_gap_anomalies(self, df: pd.DataFrame) -> Tuple[List[Dict], int, int]:
         """Detect price gaps (gap up/down at market open)"""
-        df = df.copy()
-        df['Gap'] = ((df['Open'] - df['Close'].shift(1)) / df['Close'].shift(1)) * 100
-        df_reset = df.reset_index(drop=True)
-
-        anomalies = []
-        for i in range(1, len(df_reset)):  # Start from 1 to have previous close
-            row = df_reset.iloc[i]
-            if pd.notna(row['Gap']) and abs(row['Gap']) > 2.0:  # More than 2% gap
-                prev_row = df_reset.iloc[i-1]
-                anomalies.append({
-                    "date": row['Date'].strftime('%Y-%m-%d'),
-                    "gap_pct": float(row['Gap']),
-                    "prev_close": float(prev_row['Close']),
-                    "open": float(row['Open']),
-                    "type": "GAP_UP" if row['Gap'] > 0 else "GAP_DOWN",
-                    "severity": "HIGH" if abs(row['Gap']) > 5 else "MEDIUM"
-                })
-
-        return sorted(anomalies, key=lambda x: abs(x['gap_pct']), reverse=True)[:10]
-
-    def _detect_range_breakouts(self, df: pd.DataFrame, window: int = 20) -> List[Dict]:
+        if 'Gap' not in df.columns:
+            return [], 0, 0
+
+        gap = df['Gap'].to_numpy(dtype=float)
+        gap_size = np.abs(gap)
+        pos = np.flatnonzero(gap_size > 2.0)  # More than 2% gap; NaN (first row) compares False
+        pos = pos[_top_k(gap_size[pos])]
+
+        hits = df.iloc[pos]
+        gap_hit = gap[pos]
+        is_high = gap_size[pos] > 5
+
+        anomalies = [
+            {
+                "date": date,
+                "gap_pct": gap_pct,
+                "prev_close": prev_close,
+                "open": open_price,
+                "type": kind,
+                "severity": severity
+            }
+            for date, gap_pct, prev_close, open_price, kind, severity in zip(
+                hits['DateStr'].tolist(),
+                gap_hit.tolist(),
+                hits['Prev_Close'].to_numpy(dtype=float).tolist(),
+                hits['Open'].to_numpy(dtype=float).tolist(),
+                np.where(gap_hit > 0, 'GAP_UP', 'GAP_DOWN').tolist(),
+                np.where(is_high, 'HIGH', 'MEDIUM').tolist()
+            )
+        ]
+        return anomalies, *self._severity_counts(is_high)
+
+    def _detect_range_breakouts(self, df: pd.DataFrame) -> Tuple[List[Dict], int, int]:
         """Detect breakouts from normal trading range"""
-        df = df.copy()
-        df['Upper_Range'] = df['High'].rolling(window=window).max()
-        df['Lower_Range'] = df['Low'].rolling(window=window).min()
-
-        anomalies = []
-        df_reset = df.reset_index(drop=True)
-
-        for i in range(window, len(df_reset)):
-            row = df_reset.iloc[i]
-            prev_upper = df_reset.iloc[i-1]['Upper_Range']
-            prev_lower = df_reset.iloc[i-1]['Lower_Range']
-
-            if pd.isna(prev_upper) or pd.isna(prev_lower):
-                continue
-
-            # Breakout above range
-            if row['Close'] > prev_upper:
-                pct_above = ((row['Close'] - prev_upper) / prev_upper) * 100
-                if pct_above > 1:  # More than 1% above range
-                    anomalies.append({
-                        "date": row['Date'].strftime('%Y-%m-%d'),
-                        "price": float(row['Close']),
-                        "range_level": float(prev_upper),
-                        "breakout_pct": float(pct_above),
-                        "type": "UPSIDE_BREAKOUT",
-                        "severity": "HIGH" if pct_above > 3 else "MEDIUM"
-                    })
-
-            # Breakdown below range
-            if row['Close'] < prev_lower:
-                pct_below = ((prev_lower - row['Close']) / prev_lower) * 100
-                if pct_below > 1:
-                    anomalies.append({
-                        "date": row['Date'].strftime('%Y-%m-%d'),
-                        "price": float(row['Close']),
-                        "range_level": float(prev_lower),
-                        "breakout_pct": float(-pct_below),
-                        "type": "DOWNSIDE_BREAKDOWN",
-                        "severity": "HIGH" if pct_below > 3 else "MEDIUM"
-                    })
-
-        return sorted(anomalies, key=lambda x: abs(x['breakout_pct']), reverse=True)[:10]
+        if 'Upper_Range' not in df.columns:
+            return [], 0, 0
+
+        upper_prev = df['Upper_Range'].shift(1).to_numpy(dtype=np.float32)
+        lower_prev = df['Lower_Range'].shift(1).to_numpy(dtype=np.float32)
+        idx, pct = _find_breakouts(df['Close'].to_numpy(dtype=np.float32), upper_prev, lower_prev)
+        top = _top_k(np.abs(pct))
+        idx, pct = idx[top], pct[top]
+
+        hits = df.iloc[idx]
+        upside = pct > 0
+        is_high = np.abs(pct) > 3
+
+        anomalies = [
+            {
+                "date": date,
+                "price": price,
+                "range_level": level,
+                "breakout_pct": breakout,
+                "type": kind,
+                "severity": severity
+            }
+            for date, price, level, breakout, kind, severity in zip(
+                hits['DateStr'].tolist(),
+                hits['Close'].to_numpy(dtype=float).tolist(),
+                np.where(upside, upper_prev[idx], lower_prev[idx]).astype(float).tolist(),
+                pct.tolist(),
+                np.where(upside, 'UPSIDE_BREAKOUT', 'DOWNSIDE_BREAKDOWN').tolist(),
+                np.where(is_high, 'HIGH', 'MEDIUM').tolist()
+            )
+        ]
+        return anomalies, *self._severity_counts(is_high)
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute anomaly detection analysis"""
@@ -232,8 +399,11 @@ class AnomalyDetectionTool:
         if not symbol:
             return {"error": "Symbol is required"}
 
-        # Load stock data
-        df = self._load_stock_data(symbol)
+        if not is_valid_symbol(symbol):
+            return {"error": f"Invalid symbol: {symbol}"}
+
+        # Load only the rows the analysis window needs (plus extra for statistical calculations)
+        df = self._load_stock_data(symbol, period + 50)
         if df is None:
             return {
                 "error": f"No data found for {symbol}",
@@ -243,7 +413,7 @@ class AnomalyDetectionTool:
         # Get recent data (plus extra for statistical calculations)
         df_recent = df.tail(period + 50)
 
-        if len(df_recent) < 30:
+        if len(df_recent) < self.MIN_ROWS:
             return {
                 "error": f"Insufficient data for {symbol}",
                 "available_days": len(df_recent)
@@ -252,66 +422,72 @@ class AnomalyDetectionTool:
         # Get threshold based on sensitivity
         threshold = self._get_threshold(sensitivity)
 
-        # Detect various anomalies
-        price_anomalies = self._detect_price_anomalies_zscore(df_recent, threshold)
-        volume_anomalies = self._detect_volume_anomalies(df_recent, threshold)
-        volatility_anomalies = self._detect_volatility_anomalies(df_recent)
-        gap_anomalies = self._detect_gap_anomalies(df_recent)
-        breakout_anomalies = self._detect_range_breakouts(df_recent)
-
-        # Get latest stats
-        latest = df_recent.iloc[-1]
-        recent_volatility = df_recent['Close'].pct_change().std() * np.sqrt(252) * 100
+        # Derived columns are computed once and shared by every detector
+        prepared = self._prepare(df_recent)
 
-        # Count anomalies by severity
-        all_anomalies = (price_anomalies + volume_anomalies + volatility_anomalies +
-                        gap_anomalies + breakout_anomalies)
+        # Detect various anomalies; each detector reports its own severity counts
+        detections = {
+            "price_anomalies": self._detect_price_anomalies_zscore(prepared, threshold),
+            "volume_anomalies": self._detect_volume_anomalies(prepared, threshold),
+            "volatility_anomalies": self._detect_volatility_anomalies(prepared),
+            "gap_anomalies": self._detect_gap_anomalies(prepared),
+            "breakout_anomalies": self._detect_range_breakouts(prepared)
+        }
+        anomaly_lists = [found for found, _, _ in detections.values()]
+        total_count = sum(len(found) for found in anomaly_lists)
+        high_severity_count = sum(high for _, high, _ in detections.values())
+        medium_severity_count = sum(medium for _, _, medium in detections.values())
 
-        high_severity_count = sum(1 for a in all_anomalies if a.get('severity') == 'HIGH')
-        medium_severity_count = sum(1 for a in all_anomalies if a.get('severity') == 'MEDIUM')
+        # Get latest stats
+        returns = prepared['Returns']
+        recent_volatility = returns.std() * np.sqrt(252) * 100
 
         return {
             "symbol": symbol,
-            "date": latest['Date'].strftime('%Y-%m-%d'),
-            "current_price": float(latest['Close']),
+            "date": prepared['DateStr'].iat[-1],
+            "current_price": float(prepared['Close'].iat[-1]),
             "analysis_period_days": len(df_recent),
             "sensitivity": sensitivity,
             "statistics": {
                 "current_volatility_pct": float(recent_volatility),
-                "avg_daily_change_pct": float(df_recent['Close'].pct_change().mean() * 100),
-                "total_anomalies_detected": len(all_anomalies),
+                "avg_daily_change_pct": float(returns.mean() * 100),
+                "total_anomalies_detected": total_count,
                 "high_severity_count": high_severity_count,
                 "medium_severity_count": medium_severity_count
             },
             "anomalies": {
-                "price_anomalies": price_anomalies[:5],
-                "volume_anomalies": volume_anomalies[:5],
-                "volatility_anomalies": volatility_anomalies[:5],
-                "gap_anomalies": gap_anomalies[:5],
-                "breakout_anomalies": breakout_anomalies[:5]
+                name: found[:5] for name, (found, _, _) in detections.items()
             },
-            "summary": self._generate_summary(all_anomalies, high_severity_count, medium_severity_count),
+            "summary": self._generate_summary(
+                anomaly_lists, total_count, high_severity_count, medium_severity_count
+            ),
             "data_source": "Historical CSV data"
         }
 
-    def _generate_summary(self, all_anomalies: List[Dict], high_count: int, medium_count: int) -> str:
+    def _generate_summary(self, anomaly_lists: List[List[Dict]], total_count: int,
+                          high_count: int, medium_count: int) -> str:
         """Generate human-readable summary"""
-        if not all_anomalies:
+        if not total_count:
             return "No significant anomalies detected in the analysis period"
 
         summary_parts = []
-        summary_parts.append(f"Total anomalies: {len(all_anomalies)}")
+        summary_parts.append(f"Total anomalies: {total_count}")
         summary_parts.append(f"High severity: {high_count}")
         summary_parts.append(f"Medium severity: {medium_count}")
 
         # Recent anomaly
-        if all_anomalies:
-            most_recent = max(all_anomalies, key=lambda x: x['date'])
-            anomaly_type = most_recent.get('type', 'Unknown')
-            summary_parts.append(f"Most recent: {anomaly_type} on {most_recent['date']}")
+        most_recent = max(itertools.chain.from_iterable(anomaly_lists), key=lambda x: x['date'])
+        anomaly_type = most_recent.get('type', 'Unknown')
+        summary_parts.append(f"Most recent: {anomaly_type} on {most_recent['date']}")
 
         return " | ".join(summary_parts)
 
 
+# Compile the breakout kernel at import rather than on the first request
+_empty = np.zeros(1, np.float32)
+warmup(_find_breakouts, _empty, _empty, _empty)
+del _empty
+
+
 # Export for MCP server
 __all__ = ['AnomalyDetectionTool']
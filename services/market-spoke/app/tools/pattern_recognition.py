@@ -4,19 +4,59 @@ Detects support/resistance levels, trendlines, and chart patterns
 """
 
 import sys
+import asyncio
+import copy
+import time
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-from scipy.signal import argrelextrema
-from scipy.stats import linregress
+from app.utils.extrema import local_extrema_pair
+from app.utils.regression import fit_line
+from app.utils.symbols import is_valid_symbol
+
+# Only these columns feed the detectors; skipping Volume/Dividends/Stock Splits
+# saves parsing work on every cache miss.
+CSV_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close']
+
+NS_PER_DAY = 86_400_000_000_000
+
+
+@lru_cache(maxsize=128)
+def _load_csv_cached(path_str: str, mtime: float) -> pd.DataFrame:
+    """Parse a stock CSV; keyed on mtime so an updated file is re-read.
+
+    The returned frame is shared between calls and must not be mutated.
+    """
+    df = pd.read_csv(path_str, usecols=CSV_COLUMNS)
+    # Rows carry mixed DST offsets; normalize to UTC so Date is a datetime64 column
+    df['Date'] = pd.to_datetime(df['Date'], utc=True)
+    # Sessions are stamped at local midnight (04:00/05:00 UTC), so flooring to
+    # whole UTC days keeps the trading date; only reported dates get formatted
+    df['EpochDay'] = (df['Date'].astype('int64') // NS_PER_DAY).astype('int32')
+    return df.sort_values('EpochDay', kind='mergesort', ignore_index=True)
+
+
+def _format_day(epoch_day: int) -> str:
+    """Format days since 1970-01-01 as YYYY-MM-DD"""
+    return str(np.datetime64(int(epoch_day), 'D'))
 
 
 class PatternRecognitionTool:
     """Advanced pattern recognition for technical chart analysis"""
 
+    DEFAULT_PERIOD = 60
+    # Seconds a result is served from memory; the CSVs only change once a day
+    RESULT_TTL = 900
+    MAX_CACHED_RESULTS = 256
+    # Analysed at startup so the first dashboard hit for these is a cache lookup
+    WARM_SYMBOLS = ("AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "TSLA")
+
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent.parent.parent.parent / 'data' / 'stock-data'
+        # key -> (stored at, data file mtime, result)
+        self._results: Dict[Tuple, Tuple[float, float, Dict[str, Any]]] = {}
 
     async def get_tool_info(self) -> Dict:
         """Get tool information for MCP protocol"""
@@ -49,27 +89,30 @@ class PatternRecognitionTool:
             }
         }
 
+    def _data_mtime(self, symbol: str) -> Optional[float]:
+        """Modification time of a symbol's CSV, or None if it is missing"""
+        try:
+            return (self.data_dir / f"{symbol.upper()}.csv").stat().st_mtime
+        except OSError:
+            return None
+
     def _load_stock_data(self, symbol: str) -> Optional[pd.DataFrame]:
-        """Load stock data from CSV file"""
+        """Load stock data from CSV file (cached until the file changes)"""
         try:
             file_path = self.data_dir / f"{symbol.upper()}.csv"
             if not file_path.exists():
                 return None
 
-            df = pd.read_csv(file_path)
-            df['Date'] = pd.to_datetime(df['Date'])
-            df = df.sort_values('Date')
-            return df
+            return _load_csv_cached(str(file_path), file_path.stat().st_mtime)
         except Exception as e:
             print(f"Error loading data for {symbol}: {e}", file=sys.stderr)
             return None
 
-    def _detect_trend(self, df: pd.DataFrame) -> Dict:
-        """Detect overall trend using linear regression"""
-        prices = df['Close'].values
+    def _detect_trend(self, prices: np.ndarray) -> Dict:
+        """Detect overall trend using linear regression on closing prices"""
         x = np.arange(len(prices))
 
-        slope, intercept, r_value, p_value, std_err = linregress(x, prices)
+        slope, intercept, r_value = fit_line(x, prices)
 
         # Determine trend strength
         r_squared = r_value ** 2
@@ -102,65 +145,45 @@ class PatternRecognitionTool:
             "price_change_pct": float((trend_line[-1] - trend_line[0]) / trend_line[0] * 100)
         }
 
-    def _find_support_resistance(self, df: pd.DataFrame, order: int = 5) -> Dict:
-        """Find support and resistance levels using local extrema"""
-        highs = df['High'].values
-        lows = df['Low'].values
-
-        # Find local maxima (resistance) and minima (support)
-        resistance_indices = argrelextrema(highs, np.greater, order=order)[0]
-        support_indices = argrelextrema(lows, np.less, order=order)[0]
-
-        # Get resistance levels
-        resistance_levels = []
-        for idx in resistance_indices[-5:]:  # Last 5 resistance points
-            resistance_levels.append({
-                "price": float(df.iloc[idx]['High']),
-                "date": df.iloc[idx]['Date'].strftime('%Y-%m-%d'),
-                "type": "resistance"
-            })
-
-        # Get support levels
-        support_levels = []
-        for idx in support_indices[-5:]:  # Last 5 support points
-            support_levels.append({
-                "price": float(df.iloc[idx]['Low']),
-                "date": df.iloc[idx]['Date'].strftime('%Y-%m-%d'),
-                "type": "support"
-            })
-
-        # Current price position
-        current_price = float(df.iloc[-1]['Close'])
-
-        # Find nearest support and resistance
-        nearest_support = None
-        nearest_resistance = None
-
-        if support_levels:
-            supports_below = [s for s in support_levels if s['price'] < current_price]
-            if supports_below:
-                nearest_support = max(supports_below, key=lambda x: x['price'])
-
-        if resistance_levels:
-            resistances_above = [r for r in resistance_levels if r['price'] > current_price]
-            if resistances_above:
-                nearest_resistance = min(resistances_above, key=lambda x: x['price'])
+    def _find_support_resistance(self, highs: np.ndarray, lows: np.ndarray, days: np.ndarray,
+                                 peaks: np.ndarray, troughs: np.ndarray,
+                                 current_price: float) -> Dict:
+        """Find support and resistance levels from local maxima (peaks) and minima (troughs)
+
+        ``days`` holds the window's dates as days since the Unix epoch.
+        """
+        # Last 5 resistance points, ordered by price ascending (stable for ties)
+        resistance_idx = peaks[-5:]
+        resistance_idx = resistance_idx[np.argsort(highs[resistance_idx], kind='stable')]
+        resistance_levels = [
+            {"price": float(highs[idx]), "date": _format_day(days[idx]), "type": "resistance"}
+            for idx in resistance_idx
+        ]
+
+        # Last 5 support points, ordered by price descending
+        support_idx = troughs[-5:]
+        support_idx = support_idx[np.argsort(-lows[support_idx], kind='stable')]
+        support_levels = [
+            {"price": float(lows[idx]), "date": _format_day(days[idx]), "type": "support"}
+            for idx in support_idx
+        ]
+
+        # Levels are already ordered outward from the price, so the nearest
+        # support/resistance is the first one on the right side of it
+        nearest_support = next((s for s in support_levels if s['price'] < current_price), None)
+        nearest_resistance = next((r for r in resistance_levels if r['price'] > current_price), None)
 
         return {
             "current_price": current_price,
             "nearest_support": nearest_support,
             "nearest_resistance": nearest_resistance,
-            "all_support_levels": sorted(support_levels, key=lambda x: x['price'], reverse=True),
-            "all_resistance_levels": sorted(resistance_levels, key=lambda x: x['price'])
+            "all_support_levels": support_levels,
+            "all_resistance_levels": resistance_levels
         }
 
-    def _detect_head_shoulders(self, df: pd.DataFrame) -> Optional[Dict]:
+    def _detect_head_shoulders(self, highs: np.ndarray, lows: np.ndarray,
+                               peaks: np.ndarray, troughs: np.ndarray) -> Optional[Dict]:
         """Detect head and shoulders pattern"""
-        highs = df['High'].values
-
-        # Find peaks
-        peaks = argrelextrema(highs, np.greater, order=5)[0]
-
         if len(peaks) < 3:
             return None
 
@@ -184,9 +207,6 @@ class PatternRecognitionTool:
                 }
 
         # Inverse head and shoulders on lows
-        lows = df['Low'].values
-        troughs = argrelextrema(lows, np.less, order=5)[0]
-
         if len(troughs) >= 3:
             last_troughs = troughs[-3:]
             trough_prices = [lows[i] for i in last_troughs]
@@ -206,14 +226,10 @@ class PatternRecognitionTool:
 
         return None
 
-    def _detect_double_top_bottom(self, df: pd.DataFrame) -> Optional[Dict]:
+    def _detect_double_top_bottom(self, highs: np.ndarray, lows: np.ndarray,
+                                  peaks: np.ndarray, troughs: np.ndarray) -> Optional[Dict]:
         """Detect double top or double bottom patterns"""
-        highs = df['High'].values
-        lows = df['Low'].values
-
-        # Find peaks for double top
-        peaks = argrelextrema(highs, np.greater, order=5)[0]
-
+        # Peaks for double top
         if len(peaks) >= 2:
             last_two_peaks = peaks[-2:]
             peak_prices = [highs[i] for i in last_two_peaks]
@@ -231,9 +247,7 @@ class PatternRecognitionTool:
                     "signal": "BEARISH - Reversal likely"
                 }
 
-        # Find troughs for double bottom
-        troughs = argrelextrema(lows, np.less, order=5)[0]
-
+        # Troughs for double bottom
         if len(troughs) >= 2:
             last_two_troughs = troughs[-2:]
             trough_prices = [lows[i] for i in last_two_troughs]
@@ -252,15 +266,12 @@ class PatternRecognitionTool:
 
         return None
 
-    def _detect_triangle(self, df: pd.DataFrame) -> Optional[Dict]:
-        """Detect triangle patterns (ascending, descending, symmetrical)"""
-        highs = df['High'].values
-        lows = df['Low'].values
-
-        # Get peaks and troughs
-        peaks = argrelextrema(highs, np.greater, order=3)[0]
-        troughs = argrelextrema(lows, np.less, order=3)[0]
+    def _detect_triangle(self, highs: np.ndarray, lows: np.ndarray,
+                         peaks: np.ndarray, troughs: np.ndarray) -> Optional[Dict]:
+        """Detect triangle patterns (ascending, descending, symmetrical)
 
+        Expects the finer order=3 extrema so short-lived swings are included.
+        """
         if len(peaks) < 2 or len(troughs) < 2:
             return None
 
@@ -269,8 +280,8 @@ class PatternRecognitionTool:
         recent_troughs = troughs[-3:] if len(troughs) >= 3 else troughs[-2:]
 
         # Calculate trendlines
-        peak_slope, _, peak_r, _, _ = linregress(recent_peaks, highs[recent_peaks])
-        trough_slope, _, trough_r, _, _ = linregress(recent_troughs, lows[recent_troughs])
+        peak_slope, _, peak_r = fit_line(recent_peaks, highs[recent_peaks])
+        trough_slope, _, trough_r = fit_line(recent_troughs, lows[recent_troughs])
 
         # Determine triangle type
         if abs(peak_slope) < 0.01 and trough_slope > 0.01:
@@ -303,15 +314,65 @@ class PatternRecognitionTool:
 
         return None
 
+    def _store_result(self, key: Tuple, mtime: Optional[float], result: Dict[str, Any]) -> None:
+        """Cache a successful result, evicting the oldest entry when full
+
+        ``mtime`` is the data file's modification time read before the
+        analysis, so a CSV refreshed meanwhile invalidates the entry.
+        """
+        self._results.pop(key, None)
+        if len(self._results) >= self.MAX_CACHED_RESULTS:
+            self._results.pop(next(iter(self._results)))
+        self._results[key] = (time.monotonic(), mtime, result)
+
+    async def warm_cache(self, symbols: Optional[List[str]] = None, concurrency: int = 2) -> None:
+        """Precompute default-argument results for popular symbols in worker threads"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def warm(symbol: str) -> None:
+            async with semaphore:
+                mtime = self._data_mtime(symbol)
+                result = await asyncio.to_thread(
+                    self._analyze, symbol, self.DEFAULT_PERIOD, ["all"]
+                )
+            if "error" not in result:
+                self._store_result((symbol, self.DEFAULT_PERIOD, ("all",)), mtime, result)
+
+        symbols = symbols or self.WARM_SYMBOLS
+        outcomes = await asyncio.gather(*(warm(s) for s in symbols), return_exceptions=True)
+        for symbol, outcome in zip(symbols, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"Pattern cache warm-up failed for {symbol}: {outcome}", file=sys.stderr)
+
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute pattern recognition analysis"""
         symbol = arguments.get("symbol", "").upper()
-        period = arguments.get("period", 60)
+        period = arguments.get("period", self.DEFAULT_PERIOD)
         requested_patterns = arguments.get("patterns", ["all"])
 
         if not symbol:
             return {"error": "Symbol is required"}
 
+        if not is_valid_symbol(symbol):
+            return {"error": f"Invalid symbol: {symbol}"}
+
+        key = (symbol, period, tuple(sorted(requested_patterns)))
+        mtime = self._data_mtime(symbol)
+        cached = self._results.get(key)
+        # Entries expire after RESULT_TTL or as soon as the CSV is rewritten;
+        # callers get their own copy so the cached result cannot be mutated
+        if (cached is not None and cached[1] == mtime
+                and time.monotonic() - cached[0] < self.RESULT_TTL):
+            return copy.deepcopy(cached[2])
+
+        result = self._analyze(symbol, period, requested_patterns)
+        if "error" not in result:
+            self._store_result(key, mtime, result)
+            return copy.deepcopy(result)
+        return result
+
+    def _analyze(self, symbol: str, period: int, requested_patterns: List[str]) -> Dict[str, Any]:
+        """Run the requested detectors over the last ``period`` sessions"""
         # Load stock data
         df = self._load_stock_data(symbol)
         if df is None:
@@ -333,17 +394,29 @@ class PatternRecognitionTool:
         detect_all = "all" in requested_patterns
         results = {}
 
+        # Pull the columns out once; detectors work on plain arrays
+        highs = df_recent['High'].to_numpy()
+        lows = df_recent['Low'].to_numpy()
+        closes = df_recent['Close'].to_numpy()
+        days = df_recent['EpochDay'].to_numpy()
+        current_price = float(closes[-1])
+
+        # Local extrema are shared by several detectors; find them once per request
+        peaks, troughs = local_extrema_pair(highs, lows, 5)
+
         # Detect trend
         if detect_all or "trend" in requested_patterns:
-            results["trend"] = self._detect_trend(df_recent)
+            results["trend"] = self._detect_trend(closes)
 
         # Find support/resistance
         if detect_all or "support_resistance" in requested_patterns:
-            results["support_resistance"] = self._find_support_resistance(df_recent)
+            results["support_resistance"] = self._find_support_resistance(
+                highs, lows, days, peaks, troughs, current_price
+            )
 
         # Detect head and shoulders
         if detect_all or "head_shoulders" in requested_patterns:
-            hs_pattern = self._detect_head_shoulders(df_recent)
+            hs_pattern = self._detect_head_shoulders(highs, lows, peaks, troughs)
             if hs_pattern:
                 results["head_shoulders"] = hs_pattern
             else:
@@ -351,7 +424,7 @@ class PatternRecognitionTool:
 
         # Detect double top/bottom
         if detect_all or "double_top_bottom" in requested_patterns:
-            dt_pattern = self._detect_double_top_bottom(df_recent)
+            dt_pattern = self._detect_double_top_bottom(highs, lows, peaks, troughs)
             if dt_pattern:
                 results["double_top_bottom"] = dt_pattern
             else:
@@ -359,19 +432,19 @@ class PatternRecognitionTool:
 
         # Detect triangle
         if detect_all or "triangle" in requested_patterns:
-            triangle_pattern = self._detect_triangle(df_recent)
+            triangle_pattern = self._detect_triangle(
+                highs, lows, *local_extrema_pair(highs, lows, 3)
+            )
             if triangle_pattern:
                 results["triangle"] = triangle_pattern
             else:
                 results["triangle"] = {"pattern": "NOT_DETECTED"}
 
         # Get latest price info
-        latest = df_recent.iloc[-1]
-
         return {
             "symbol": symbol,
-            "date": latest['Date'].strftime('%Y-%m-%d'),
-            "current_price": float(latest['Close']),
+            "date": _format_day(days[-1]),
+            "current_price": current_price,
             "analysis_period_days": len(df_recent),
             "patterns": results,
             "summary": self._generate_summary(results),
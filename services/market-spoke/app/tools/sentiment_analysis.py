@@ -8,14 +8,46 @@ import asyncio
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import re
+from collections import Counter
+
+from .unified_market_data import FinancialNewsTool
+
+
+# Keyword lexicons, built once at import rather than on every text scored
+POSITIVE_KEYWORDS = (
+    'surge', 'soar', 'rally', 'gain', 'rise', 'jump', 'climb', 'advance',
+    'outperform', 'beat', 'exceed', 'strong', 'growth', 'profit', 'bullish',
+    'upgrade', 'positive', 'buy', 'success', 'innovation', 'breakthrough',
+    'record', 'high', 'boom', 'upbeat', 'optimistic', 'excellent'
+)
+
+NEGATIVE_KEYWORDS = (
+    'plunge', 'crash', 'fall', 'drop', 'decline', 'slump', 'tumble', 'slide',
+    'underperform', 'miss', 'disappoint', 'weak', 'loss', 'bearish',
+    'downgrade', 'negative', 'sell', 'failure', 'concern', 'worry',
+    'low', 'bust', 'pessimistic', 'poor', 'risk', 'warning'
+)
+
+NEUTRAL_KEYWORDS = (
+    'stable', 'unchanged', 'flat', 'mixed', 'neutral', 'hold',
+    'maintain', 'steady', 'moderate'
+)
+
+# Distribution buckets for the 1-5 sentiment scale
+SCORE_LABELS = (
+    ("very_positive", 5),
+    ("positive", 4),
+    ("neutral", 3),
+    ("negative", 2),
+    ("very_negative", 1)
+)
 
 
 class SentimentAnalysisTool:
     """Enhanced sentiment analysis combining news sentiment with market momentum"""
 
     def __init__(self):
-        # Import news tool for sentiment analysis
-        from .unified_market_data import FinancialNewsTool
+        # News tool for sentiment analysis
         self.news_tool = FinancialNewsTool()
 
     async def get_tool_info(self) -> Dict:
@@ -48,32 +80,10 @@ class SentimentAnalysisTool:
         """Analyze sentiment of text using keyword-based approach"""
         text_lower = text.lower()
 
-        # Positive keywords
-        positive_keywords = [
-            'surge', 'soar', 'rally', 'gain', 'rise', 'jump', 'climb', 'advance',
-            'outperform', 'beat', 'exceed', 'strong', 'growth', 'profit', 'bullish',
-            'upgrade', 'positive', 'buy', 'success', 'innovation', 'breakthrough',
-            'record', 'high', 'boom', 'upbeat', 'optimistic', 'excellent'
-        ]
-
-        # Negative keywords
-        negative_keywords = [
-            'plunge', 'crash', 'fall', 'drop', 'decline', 'slump', 'tumble', 'slide',
-            'underperform', 'miss', 'disappoint', 'weak', 'loss', 'bearish',
-            'downgrade', 'negative', 'sell', 'failure', 'concern', 'worry',
-            'low', 'bust', 'pessimistic', 'poor', 'risk', 'warning'
-        ]
-
-        # Neutral keywords
-        neutral_keywords = [
-            'stable', 'unchanged', 'flat', 'mixed', 'neutral', 'hold',
-            'maintain', 'steady', 'moderate'
-        ]
-
         # Count keyword occurrences
-        positive_count = sum(1 for word in positive_keywords if word in text_lower)
-        negative_count = sum(1 for word in negative_keywords if word in text_lower)
-        neutral_count = sum(1 for word in neutral_keywords if word in text_lower)
+        positive_count = sum(1 for word in POSITIVE_KEYWORDS if word in text_lower)
+        negative_count = sum(1 for word in NEGATIVE_KEYWORDS if word in text_lower)
+        neutral_count = sum(1 for word in NEUTRAL_KEYWORDS if word in text_lower)
 
         total_count = positive_count + negative_count + neutral_count
 
@@ -153,13 +163,10 @@ class SentimentAnalysisTool:
         else:
             overall_label = "VERY_NEGATIVE"
 
-        # Calculate distribution
+        # Calculate distribution in a single pass over the scores
+        score_counts = Counter(sentiment_scores)
         score_distribution = {
-            "very_positive": sum(1 for s in sentiment_scores if s == 5),
-            "positive": sum(1 for s in sentiment_scores if s == 4),
-            "neutral": sum(1 for s in sentiment_scores if s == 3),
-            "negative": sum(1 for s in sentiment_scores if s == 2),
-            "very_negative": sum(1 for s in sentiment_scores if s == 1)
+            label: score_counts[score] for label, score in SCORE_LABELS
         }
 
         confidence = "HIGH" if len(news_articles) >= 10 else "MEDIUM" if len(news_articles) >= 5 else "LOW"
@@ -4,10 +4,29 @@ Analyzes relative performance, correlation, and comparative metrics
 """
 
 import sys
+import asyncio
+from functools import lru_cache
+from heapq import nlargest
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+from app.utils.symbols import is_valid_symbol
+
+# Every comparison metric is derived from closing prices alone
+CSV_COLUMNS = ['Date', 'Close']
+
+
+@lru_cache(maxsize=128)
+def _load_csv_cached(path_str: str, mtime: float) -> pd.DataFrame:
+    """Parse a stock CSV; keyed on mtime so an updated file is re-read.
+
+    The returned frame is shared between calls and must not be mutated.
+    """
+    df = pd.read_csv(path_str, usecols=CSV_COLUMNS)
+    # Rows carry mixed DST offsets; normalize to UTC so Date is a datetime64 column
+    df['Date'] = pd.to_datetime(df['Date'], utc=True)
+    return df.sort_values('Date', kind='mergesort', ignore_index=True)
 
 
 class StockComparisonTool:
@@ -44,6 +63,11 @@ class StockComparisonTool:
                         },
                         "description": "Metrics to compare (default: all)",
                         "default": ["all"]
+                    },
+                    "include_full_matrix": {
+                        "type": "boolean",
+                        "description": "Include the full correlation matrix in the correlation results (default: false)",
+                        "default": False
                     }
                 },
                 "required": ["symbols"]
@@ -51,54 +75,50 @@ class StockComparisonTool:
         }
 
     def _load_stock_data(self, symbol: str) -> Optional[pd.DataFrame]:
-        """Load stock data from CSV file"""
+        """Load stock data from CSV file (cached until the file changes)"""
         try:
             file_path = self.data_dir / f"{symbol.upper()}.csv"
             if not file_path.exists():
                 return None
 
-            df = pd.read_csv(file_path)
-            df['Date'] = pd.to_datetime(df['Date'])
-            df = df.sort_values('Date')
-            return df
+            return _load_csv_cached(str(file_path), file_path.stat().st_mtime)
         except Exception as e:
             print(f"Error loading data for {symbol}: {e}", file=sys.stderr)
             return None
 
-    def _calculate_correlation(self, price_data: Dict[str, pd.Series]) -> Dict:
-        """Calculate correlation matrix between stocks"""
-        if len(price_data) < 2:
+    def _calculate_correlation(self, symbols: List[str], returns: np.ndarray,
+                               include_matrix: bool = False) -> Dict:
+        """Calculate correlation between stocks; the full matrix only on request"""
+        if len(symbols) < 2:
             return {}
 
-        # Create DataFrame with all stock returns
-        returns_df = pd.DataFrame()
-        for symbol, prices in price_data.items():
-            returns_df[symbol] = prices.pct_change()
-
-        # Calculate correlation matrix
-        corr_matrix = returns_df.corr()
+        corr_matrix = np.corrcoef(returns)
 
-        # Convert to dict format
-        correlation_pairs = []
-        symbols = list(price_data.keys())
+        # Each unordered pair once, in the same order as a nested loop over symbols
+        rows, cols = np.triu_indices(len(symbols), k=1)
+        correlation_pairs = [
+            {
+                "stock_1": symbols[i],
+                "stock_2": symbols[j],
+                "correlation": corr_value,
+                "relationship": self._interpret_correlation(corr_value)
+            }
+            for i, j, corr_value in zip(rows.tolist(), cols.tolist(), corr_matrix[rows, cols].tolist())
+        ]
 
-        for i, sym1 in enumerate(symbols):
-            for sym2 in symbols[i+1:]:
-                corr_value = corr_matrix.loc[sym1, sym2]
-                correlation_pairs.append({
-                    "stock_1": sym1,
-                    "stock_2": sym2,
-                    "correlation": float(corr_value),
-                    "relationship": self._interpret_correlation(corr_value)
-                })
+        result = {
+            # Strongest relationships first, by absolute correlation value
+            "top_correlations": nlargest(10, correlation_pairs, key=lambda x: abs(x['correlation']))
+        }
 
-        # Sort by absolute correlation value
-        correlation_pairs = sorted(correlation_pairs, key=lambda x: abs(x['correlation']), reverse=True)
+        if include_matrix:
+            # Row/column order follows `symbols`
+            result["correlation_matrix"] = {
+                "symbols": symbols,
+                "values": corr_matrix.tolist()
+            }
 
-        return {
-            "correlation_matrix": corr_matrix.to_dict(),
-            "top_correlations": correlation_pairs[:10]
-        }
+        return result
 
     def _interpret_correlation(self, corr: float) -> str:
         """Interpret correlation coefficient"""
@@ -117,40 +137,41 @@ class StockComparisonTool:
         direction = "Positive" if corr > 0 else "Negative"
         return f"{strength} {direction}"
 
-    def _calculate_performance(self, price_data: Dict[str, pd.Series], period: int) -> Dict:
+    def _calculate_performance(self, symbols: List[str], prices: np.ndarray) -> Dict:
         """Calculate performance metrics for each stock"""
         performance = {}
+        days = prices.shape[1]
 
-        for symbol, prices in price_data.items():
-            if len(prices) < 2:
-                continue
-
-            start_price = prices.iloc[0]
-            end_price = prices.iloc[-1]
+        if days >= 2:
+            start_price = prices[:, 0]
+            end_price = prices[:, -1]
             total_return = ((end_price - start_price) / start_price) * 100
 
             # Calculate annualized return
-            days = len(prices)
             years = days / 252  # Trading days per year
-            annualized_return = ((end_price / start_price) ** (1 / years) - 1) * 100 if years > 0 else 0
+            annualized_return = ((end_price / start_price) ** (1 / years) - 1) * 100
 
             # Calculate max/min during period
-            max_price = prices.max()
-            min_price = prices.min()
+            max_price = prices.max(axis=1)
+            min_price = prices.min(axis=1)
             max_return = ((max_price - start_price) / start_price) * 100
-            max_drawdown = ((min_price - max_price) / max_price) * 100
-
-            performance[symbol] = {
-                "start_price": float(start_price),
-                "end_price": float(end_price),
-                "total_return_pct": float(total_return),
-                "annualized_return_pct": float(annualized_return),
-                "max_price": float(max_price),
-                "min_price": float(min_price),
-                "max_gain_pct": float(max_return),
-                "max_drawdown_pct": float(max_drawdown),
-                "period_days": days
-            }
+            # Deepest fall from a running peak; a low that precedes the high is
+            # not a drawdown
+            running_peak = np.maximum.accumulate(prices, axis=1)
+            max_drawdown = ((prices / running_peak).min(axis=1) - 1) * 100
+
+            for i, symbol in enumerate(symbols):
+                performance[symbol] = {
+                    "start_price": float(start_price[i]),
+                    "end_price": float(end_price[i]),
+                    "total_return_pct": float(total_return[i]),
+                    "annualized_return_pct": float(annualized_return[i]),
+                    "max_price": float(max_price[i]),
+                    "min_price": float(min_price[i]),
+                    "max_gain_pct": float(max_return[i]),
+                    "max_drawdown_pct": float(max_drawdown[i]),
+                    "period_days": days
+                }
 
         # Rank by total return
         ranked = sorted(performance.items(), key=lambda x: x[1]['total_return_pct'], reverse=True)
@@ -160,24 +181,22 @@ class StockComparisonTool:
             "ranking": [{"symbol": sym, "return_pct": perf['total_return_pct']} for sym, perf in ranked]
         }
 
-    def _calculate_volatility(self, price_data: Dict[str, pd.Series]) -> Dict:
+    def _calculate_volatility(self, symbols: List[str], returns: np.ndarray) -> Dict:
         """Calculate volatility metrics for each stock"""
         volatility = {}
 
-        for symbol, prices in price_data.items():
-            returns = prices.pct_change().dropna()
+        # Annualized volatility
+        daily_vol = returns.std(axis=1, ddof=1)
+        annual_vol = daily_vol * np.sqrt(252) * 100
 
-            # Annualized volatility
-            daily_vol = returns.std()
-            annual_vol = daily_vol * np.sqrt(252) * 100
-
-            # Average absolute daily change
-            avg_daily_change = abs(returns).mean() * 100
+        # Average absolute daily change
+        avg_daily_change = np.abs(returns).mean(axis=1) * 100
 
+        for i, symbol in enumerate(symbols):
             volatility[symbol] = {
-                "annualized_volatility_pct": float(annual_vol),
-                "avg_daily_change_pct": float(avg_daily_change),
-                "risk_level": self._interpret_volatility(annual_vol)
+                "annualized_volatility_pct": float(annual_vol[i]),
+                "avg_daily_change_pct": float(avg_daily_change[i]),
+                "risk_level": self._interpret_volatility(annual_vol[i])
             }
 
         # Rank by volatility
@@ -199,34 +218,29 @@ class StockComparisonTool:
         else:
             return "Very High Risk"
 
-    def _calculate_risk_return(self, price_data: Dict[str, pd.Series]) -> Dict:
+    def _calculate_risk_return(self, symbols: List[str], returns: np.ndarray) -> Dict:
         """Calculate risk-adjusted return metrics (Sharpe-like ratio)"""
         risk_return = {}
 
-        for symbol, prices in price_data.items():
-            returns = prices.pct_change().dropna()
-
-            if len(returns) < 2:
-                continue
-
+        if returns.shape[1] >= 2:
             # Calculate average return
-            avg_return = returns.mean() * 252 * 100  # Annualized
+            avg_return = returns.mean(axis=1) * 252 * 100  # Annualized
 
             # Calculate volatility
-            volatility = returns.std() * np.sqrt(252) * 100
+            volatility = returns.std(axis=1, ddof=1) * np.sqrt(252) * 100
 
             # Simple risk-adjusted return (return / volatility)
-            if volatility > 0:
-                risk_adjusted_return = avg_return / volatility
-            else:
-                risk_adjusted_return = 0
-
-            risk_return[symbol] = {
-                "avg_annual_return_pct": float(avg_return),
-                "annual_volatility_pct": float(volatility),
-                "risk_adjusted_return": float(risk_adjusted_return),
-                "rating": self._rate_risk_return(risk_adjusted_return)
-            }
+            risk_adjusted_return = np.divide(
+                avg_return, volatility, out=np.zeros_like(avg_return), where=volatility > 0
+            )
+
+            for i, symbol in enumerate(symbols):
+                risk_return[symbol] = {
+                    "avg_annual_return_pct": float(avg_return[i]),
+                    "annual_volatility_pct": float(volatility[i]),
+                    "risk_adjusted_return": float(risk_adjusted_return[i]),
+                    "rating": self._rate_risk_return(risk_adjusted_return[i])
+                }
 
         # Rank by risk-adjusted return
         ranked = sorted(risk_return.items(), key=lambda x: x[1]['risk_adjusted_return'], reverse=True)
@@ -252,6 +266,7 @@ class StockComparisonTool:
         symbols = arguments.get("symbols", [])
         period = arguments.get("period", 90)
         requested_metrics = arguments.get("metrics", ["all"])
+        include_full_matrix = bool(arguments.get("include_full_matrix", False))
 
         if not symbols or len(symbols) < 2:
             return {"error": "At least 2 symbols are required for comparison"}
@@ -259,22 +274,32 @@ class StockComparisonTool:
         if len(symbols) > 10:
             return {"error": "Maximum 10 symbols allowed for comparison"}
 
-        # Load data for all symbols
+        if not isinstance(period, int) or period < 2:
+            return {"error": "Period must be an integer of at least 2 days"}
+
+        symbols = [symbol.upper() for symbol in symbols]
+        invalid_symbols = [symbol for symbol in symbols if not is_valid_symbol(symbol)]
+        if invalid_symbols:
+            return {"error": f"Invalid symbols: {', '.join(invalid_symbols)}"}
+
+        # Load data for all symbols concurrently; CSV parsing runs off the event loop
+        frames = await asyncio.gather(
+            *(asyncio.to_thread(self._load_stock_data, symbol) for symbol in symbols)
+        )
+
         price_data = {}
         failed_symbols = []
 
-        for symbol in symbols:
-            df = self._load_stock_data(symbol.upper())
+        for symbol, df in zip(symbols, frames):
             if df is None:
-                failed_symbols.append(symbol.upper())
+                failed_symbols.append(symbol)
                 continue
 
-            # Get recent data
-            df_recent = df.tail(period + 50)
-            if len(df_recent) >= period:
-                price_data[symbol.upper()] = df_recent['Close'].tail(period)
+            # Take the last `period` closes straight from the cached frame
+            if len(df) >= period:
+                price_data[symbol] = df['Close'].iloc[-period:]
             else:
-                failed_symbols.append(symbol.upper())
+                failed_symbols.append(symbol)
 
         if len(price_data) < 2:
             return {
@@ -283,29 +308,37 @@ class StockComparisonTool:
                 "available_symbols": list(price_data.keys())
             }
 
+        # One (n_symbols, period) close matrix and its daily returns, shared by
+        # every metric instead of each recomputing pct_change per symbol
+        symbols = list(price_data.keys())
+        prices = np.stack([series.to_numpy(dtype=np.float64) for series in price_data.values()])
+        returns = np.diff(prices, axis=1) / prices[:, :-1]
+
         # Determine which metrics to calculate
         calc_all = "all" in requested_metrics
         results = {
-            "symbols_analyzed": list(price_data.keys()),
+            "symbols_analyzed": symbols,
             "failed_symbols": failed_symbols,
             "period_days": period
         }
 
         # Calculate correlation
         if calc_all or "correlation" in requested_metrics:
-            results["correlation"] = self._calculate_correlation(price_data)
+            results["correlation"] = self._calculate_correlation(
+                symbols, returns, include_matrix=include_full_matrix
+            )
 
         # Calculate performance
         if calc_all or "performance" in requested_metrics:
-            results["performance"] = self._calculate_performance(price_data, period)
+            results["performance"] = self._calculate_performance(symbols, prices)
 
         # Calculate volatility
         if calc_all or "volatility" in requested_metrics:
-            results["volatility"] = self._calculate_volatility(price_data)
+            results["volatility"] = self._calculate_volatility(symbols, returns)
 
         # Calculate risk-return
         if calc_all or "risk_return" in requested_metrics:
-            results["risk_return"] = self._calculate_risk_return(price_data)
+            results["risk_return"] = self._calculate_risk_return(symbols, returns)
 
         # Generate summary
         results["summary"] = self._generate_summary(results)
@@ -8,6 +8,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+from app.utils.symbols import is_valid_symbol
 import json
 
 
@@ -121,7 +122,7 @@ class TechnicalAnalysisTool:
     def _generate_signals(self, df: pd.DataFrame, indicators: Dict) -> Dict:
         """Generate trading signals based on indicators"""
         signals = {}
-        latest = df.iloc[-1]
+        latest_close = df['Close'].iat[-1]
 
         # RSI signals
         if 'rsi' in indicators:
@@ -147,7 +148,7 @@ class TechnicalAnalysisTool:
 
         # Bollinger Bands signals
         if 'bollinger' in indicators:
-            price = latest['Close']
+            price = latest_close
             upper = indicators['bollinger']['upper_band'].iloc[-1]
             lower = indicators['bollinger']['lower_band'].iloc[-1]
 
@@ -160,7 +161,7 @@ class TechnicalAnalysisTool:
 
         # Moving Average signals
         if 'sma' in indicators:
-            price = latest['Close']
+            price = latest_close
             sma_20 = indicators['sma']['sma_20'].iloc[-1]
             sma_50 = indicators['sma']['sma_50'].iloc[-1]
 
@@ -182,6 +183,9 @@ class TechnicalAnalysisTool:
         if not symbol:
             return {"error": "Symbol is required"}
 
+        if not is_valid_symbol(symbol):
+            return {"error": f"Invalid symbol: {symbol}"}
+
         # Load stock data
         df = self._load_stock_data(symbol)
         if df is None:
@@ -261,13 +265,11 @@ class TechnicalAnalysisTool:
         signals = self._generate_signals(df_recent, calculated)
 
         # Get latest price info
-        latest = df_recent.iloc[-1]
-
         return {
             "symbol": symbol,
-            "date": latest['Date'].strftime('%Y-%m-%d'),
-            "current_price": float(latest['Close']),
-            "volume": int(latest['Volume']) if 'Volume' in latest else None,
+            "date": df_recent['Date'].iat[-1].strftime('%Y-%m-%d'),
+            "current_price": float(df_recent['Close'].iat[-1]),
+            "volume": int(df_recent['Volume'].iat[-1]) if 'Volume' in df_recent.columns else None,
             "indicators": indicators_result,
             "signals": signals,
             "summary": self._generate_summary(indicators_result, signals),
@@ -3,9 +3,21 @@ Unified Market Data Tool - MCP wrapper for UnifiedAPIManager
 Provides comprehensive market data access through MCP protocol
 """
 
+import asyncio
 import json
+import time
+from types import MappingProxyType
 from typing import Dict, Any, List
-from app.clients.unified_api_manager import UnifiedAPIManager
+from app.clients.unified_api_manager import get_shared_manager
+
+# Map query_type values to data_type values
+QUERY_TYPE_MAPPING = MappingProxyType({
+    "stock_quote": "stock",
+    "crypto_price": "crypto",
+    "news": "news",
+    "economic": "economic",
+    "overview": "overview"
+})
 
 
 class UnifiedMarketDataTool:
@@ -62,69 +74,60 @@ class UnifiedMarketDataTool:
         # Support both 'data_type' and 'query_type' for compatibility
         data_type = arguments.get("data_type") or arguments.get("query_type")
 
-        # Map query_type values to data_type values
-        type_mapping = {
-            "stock_quote": "stock",
-            "crypto_price": "crypto",
-            "news": "news",
-            "economic": "economic",
-            "overview": "overview"
-        }
-
         # Convert query_type format to data_type format
-        if data_type in type_mapping:
-            data_type = type_mapping[data_type]
+        if data_type in QUERY_TYPE_MAPPING:
+            data_type = QUERY_TYPE_MAPPING[data_type]
 
         # Create API manager context
-        async with UnifiedAPIManager() as api_manager:
-            if data_type == "stock":
-                symbol = arguments.get("symbol")
-                if not symbol:
-                    return {"error": "Symbol is required for stock data"}
+        api_manager = get_shared_manager()
+        if data_type == "stock":
+            symbol = arguments.get("symbol")
+            if not symbol:
+                return {"error": "Symbol is required for stock data"}
 
-                result = await api_manager.get_stock_quote(symbol)
-                return result if result else {"error": f"Failed to get stock quote for {symbol}"}
+            result = await api_manager.get_stock_quote(symbol)
+            return result if result else {"error": f"Failed to get stock quote for {symbol}"}
 
-            elif data_type == "crypto":
-                coin_id = arguments.get("symbol", "bitcoin")
-                result = await api_manager.get_crypto_price(coin_id)
-                return result if result else {"error": f"Failed to get crypto price for {coin_id}"}
+        elif data_type == "crypto":
+            coin_id = arguments.get("symbol", "bitcoin")
+            result = await api_manager.get_crypto_price(coin_id)
+            return result if result else {"error": f"Failed to get crypto price for {coin_id}"}
 
-            elif data_type == "news":
-                query = arguments.get("query", "stock market")
-                page_size = arguments.get("page_size", 10)
-                result = await api_manager.get_financial_news(query, page_size)
-                return {"articles": result} if result else {"error": "Failed to get news"}
+        elif data_type == "news":
+            query = arguments.get("query", "stock market")
+            page_size = arguments.get("page_size", 10)
+            result = await api_manager.get_financial_news(query, page_size)
+            return {"articles": result} if result else {"error": "Failed to get news"}
 
-            elif data_type == "economic":
-                # Support both 'series_id' and 'indicator' for compatibility
-                series_id = arguments.get("series_id") or arguments.get("indicator", "GDP")
-                limit = arguments.get("limit", 10)
-                result = await api_manager.get_economic_indicator(series_id, limit)
-                return result if result else {"error": f"Failed to get economic data for {series_id}"}
+        elif data_type == "economic":
+            # Support both 'series_id' and 'indicator' for compatibility
+            series_id = arguments.get("series_id") or arguments.get("indicator", "GDP")
+            limit = arguments.get("limit", 10)
+            result = await api_manager.get_economic_indicator(series_id, limit)
+            return result if result else {"error": f"Failed to get economic data for {series_id}"}
 
-            elif data_type == "sanctions":
-                query = arguments.get("query")
-                if not query:
-                    return {"error": "Query is required for sanctions check"}
+        elif data_type == "sanctions":
+            query = arguments.get("query")
+            if not query:
+                return {"error": "Query is required for sanctions check"}
 
-                result = await api_manager.check_sanctions(query)
-                return result if result else {"error": f"Failed to check sanctions for {query}"}
+            result = await api_manager.check_sanctions(query)
+            return result if result else {"error": f"Failed to check sanctions for {query}"}
 
-            elif data_type == "batch":
-                symbols = arguments.get("symbols")
-                if not symbols:
-                    return {"error": "Symbols list is required for batch operations"}
+        elif data_type == "batch":
+            symbols = arguments.get("symbols")
+            if not symbols:
+                return {"error": "Symbols list is required for batch operations"}
 
-                result = await api_manager.get_multiple_quotes(symbols)
-                return {"quotes": result}
+            result = await api_manager.get_multiple_quotes(symbols)
+            return {"quotes": result}
 
-            elif data_type == "overview":
-                result = await api_manager.get_market_overview()
-                return result if result else {"error": "Failed to get market overview"}
+        elif data_type == "overview":
+            result = await api_manager.get_market_overview()
+            return result if result else {"error": "Failed to get market overview"}
 
-            else:
-                return {"error": f"Unknown data type: {data_type}"}
+        else:
+            return {"error": f"Unknown data type: {data_type}"}
 
 
 class StockQuoteTool:
@@ -151,9 +154,9 @@ class StockQuoteTool:
         if not symbol:
             return {"error": "Symbol is required"}
 
-        async with UnifiedAPIManager() as api_manager:
-            result = await api_manager.get_stock_quote(symbol)
-            return result if result else {"error": f"Failed to get stock quote for {symbol}"}
+        api_manager = get_shared_manager()
+        result = await api_manager.get_stock_quote(symbol)
+        return result if result else {"error": f"Failed to get stock quote for {symbol}"}
 
 
 class CryptoPriceTool:
@@ -178,9 +181,9 @@ class CryptoPriceTool:
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         coin_id = arguments.get("coin_id", "bitcoin")
 
-        async with UnifiedAPIManager() as api_manager:
-            result = await api_manager.get_crypto_price(coin_id)
-            return result if result else {"error": f"Failed to get crypto price for {coin_id}"}
+        api_manager = get_shared_manager()
+        result = await api_manager.get_crypto_price(coin_id)
+        return result if result else {"error": f"Failed to get crypto price for {coin_id}"}
 
 
 class FinancialNewsTool:
@@ -210,9 +213,9 @@ class FinancialNewsTool:
         query = arguments.get("query", "stock market")
         page_size = arguments.get("page_size", 10)
 
-        async with UnifiedAPIManager() as api_manager:
-            result = await api_manager.get_financial_news(query, page_size)
-            return {"articles": result, "count": len(result)} if result else {"error": "Failed to get news"}
+        api_manager = get_shared_manager()
+        result = await api_manager.get_financial_news(query, page_size)
+        return {"articles": result, "count": len(result)} if result else {"error": "Failed to get news"}
 
 
 class EconomicIndicatorTool:
@@ -242,14 +245,21 @@ class EconomicIndicatorTool:
         series_id = arguments.get("series_id", "GDP")
         limit = arguments.get("limit", 10)
 
-        async with UnifiedAPIManager() as api_manager:
-            result = await api_manager.get_economic_indicator(series_id, limit)
-            return result if result else {"error": f"Failed to get economic data for {series_id}"}
+        api_manager = get_shared_manager()
+        result = await api_manager.get_economic_indicator(series_id, limit)
+        return result if result else {"error": f"Failed to get economic data for {series_id}"}
 
 
 class MarketOverviewTool:
     """Tool for comprehensive market overview"""
 
+    # Seconds an overview is served from memory; it fans out to seven upstream calls
+    OVERVIEW_TTL = 60
+
+    def __init__(self):
+        self._last_overview = (0.0, None)
+        self._inflight = None
+
     async def get_tool_info(self) -> Dict:
         return {
             "name": "get_overview",
@@ -260,15 +270,41 @@ class MarketOverviewTool:
             }
         }
 
-    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        async with UnifiedAPIManager() as api_manager:
+    async def _fetch_overview(self) -> Dict[str, Any]:
+        try:
+            api_manager = get_shared_manager()
             result = await api_manager.get_market_overview()
-            return result if result else {"error": "Failed to get market overview"}
+        finally:
+            self._inflight = None
+
+        if not result:
+            return {"error": "Failed to get market overview"}
+        self._last_overview = (time.monotonic(), result)
+        return result
+
+    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        fetched_at, overview = self._last_overview
+        if overview is not None and time.monotonic() - fetched_at < self.OVERVIEW_TTL:
+            return overview
+
+        # Concurrent callers share one upstream fetch instead of each fanning out
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._fetch_overview())
+        return await asyncio.shield(self._inflight)
 
 
 class APIStatusTool:
     """Tool for checking API health and status"""
 
+    # Seconds a probe is reused before the providers are pinged again; a failed
+    # probe is held briefly so dashboards polling during an outage don't hammer
+    # the fallback providers
+    PROBE_TTL = 30
+    FAILED_PROBE_TTL = 10
+
+    def __init__(self):
+        self._last_probe = (0.0, 0.0, None)
+
     async def get_tool_info(self) -> Dict:
         return {
             "name": "get_api_status",
@@ -280,7 +316,15 @@ class APIStatusTool:
         }
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        async with UnifiedAPIManager() as api_manager:
-            # Trigger a test call first
-            await api_manager.get_stock_quote("AAPL")
-            return api_manager.get_api_status()
+        probed_at, ttl, status = self._last_probe
+        if status is not None and time.monotonic() - probed_at < ttl:
+            return status
+
+        api_manager = get_shared_manager()
+        # Trigger a test call first
+        quote = await api_manager.get_stock_quote("AAPL")
+        status = api_manager.get_api_status()
+
+        ttl = self.PROBE_TTL if quote else self.FAILED_PROBE_TTL
+        self._last_probe = (time.monotonic(), ttl, status)
+        return status
@@ -0,0 +1,98 @@
+"""
+Local extrema kernels - compiled replacements for scipy.signal.argrelextrema
+
+Semantics match ``argrelextrema(a, np.greater/np.less, order=order)`` with its
+default ``mode='clip'``: a point must be strictly greater (smaller) than every
+neighbor within ``order`` positions, windows are clipped at the array ends and
+the first/last points are never extrema. NaN never qualifies.
+"""
+
+import numpy as np
+
+from app.utils.jit import njit, warmup
+
+
+@njit(cache=True)
+def local_maxima(a: np.ndarray, order: int) -> np.ndarray:
+    """Indices of strict local maxima within +/- order points"""
+    n = a.shape[0]
+    out = np.empty(n, np.int64)
+    count = 0
+    for i in range(1, n - 1):
+        lo = max(0, i - order)
+        hi = min(n - 1, i + order)
+        is_peak = True
+        for j in range(lo, hi + 1):
+            if j != i and not a[i] > a[j]:
+                is_peak = False
+                break
+        if is_peak:
+            out[count] = i
+            count += 1
+    return out[:count]
+
+
+@njit(cache=True)
+def local_minima(a: np.ndarray, order: int) -> np.ndarray:
+    """Indices of strict local minima within +/- order points"""
+    n = a.shape[0]
+    out = np.empty(n, np.int64)
+    count = 0
+    for i in range(1, n - 1):
+        lo = max(0, i - order)
+        hi = min(n - 1, i + order)
+        is_trough = True
+        for j in range(lo, hi + 1):
+            if j != i and not a[i] < a[j]:
+                is_trough = False
+                break
+        if is_trough:
+            out[count] = i
+            count += 1
+    return out[:count]
+
+
+@njit(cache=True)
+def local_extrema_pair(highs: np.ndarray, lows: np.ndarray, order: int):
+    """(local_maxima(highs, order), local_minima(lows, order)) in one pass
+
+    Both series are walked together, so each window is read once instead of
+    twice. highs and lows must have the same length.
+    """
+    n = highs.shape[0]
+    peaks = np.empty(n, np.int64)
+    troughs = np.empty(n, np.int64)
+    n_peaks = 0
+    n_troughs = 0
+    for i in range(1, n - 1):
+        lo = max(0, i - order)
+        hi = min(n - 1, i + order)
+        # Separate inner scans keep the early exit: most points fail on a
+        # neighbor or two for one side
+        is_peak = True
+        for j in range(lo, hi + 1):
+            if j != i and not highs[i] > highs[j]:
+                is_peak = False
+                break
+        if is_peak:
+            peaks[n_peaks] = i
+            n_peaks += 1
+
+        is_trough = True
+        for j in range(lo, hi + 1):
+            if j != i and not lows[i] < lows[j]:
+                is_trough = False
+                break
+        if is_trough:
+            troughs[n_troughs] = i
+            n_troughs += 1
+    return peaks[:n_peaks], troughs[:n_troughs]
+
+
+# Compile the float64 price signature pattern recognition uses at import
+warmup(local_maxima, np.zeros(30, np.float64), 5)
+warmup(local_minima, np.zeros(30, np.float64), 5)
+warmup(local_extrema_pair, np.zeros(30, np.float64), np.zeros(30, np.float64), 5)
+
+
+__all__ = ['local_maxima', 'local_minima', 'local_extrema_pair']
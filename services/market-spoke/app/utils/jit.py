@@ -0,0 +1,29 @@
+"""
+JIT helpers - Numba-compiled kernels with a pure Python fallback
+"""
+
+import sys
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; kernels run interpreted without it
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and parameterized use)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def warmup(kernel, *args) -> None:
+    """Compile a kernel for the given argument types (or load it from the cache=True
+    on-disk cache) so the first request does not pay the JIT cost"""
+    try:
+        kernel(*args)
+    except Exception as e:  # a failed warm-up must never break the import
+        print(f"JIT warm-up failed for {getattr(kernel, '__name__', kernel)}: {e}", file=sys.stderr)
+
+
+__all__ = ['njit', 'warmup', 'NUMBA_AVAILABLE']
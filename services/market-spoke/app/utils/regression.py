@@ -0,0 +1,50 @@
+"""
+Regression kernels - compiled least-squares fits for short price series
+"""
+
+import numpy as np
+
+from app.utils.jit import njit, warmup
+
+
+@njit(cache=True)
+def fit_line(x: np.ndarray, y: np.ndarray):
+    """Least-squares line through (x, y) as (slope, intercept, r)
+
+    Closed form of scipy.stats.linregress without the p-value/stderr work.
+    Sums are accumulated in float64 whatever the input dtypes; x must hold at
+    least two distinct values. As in linregress, r is 0 when y is constant.
+    """
+    n = x.shape[0]
+    x_mean = 0.0
+    y_mean = 0.0
+    for i in range(n):
+        x_mean += x[i]
+        y_mean += y[i]
+    x_mean /= n
+    y_mean /= n
+
+    ssxx = 0.0
+    ssxy = 0.0
+    ssyy = 0.0
+    for i in range(n):
+        dx = x[i] - x_mean
+        dy = y[i] - y_mean
+        ssxx += dx * dx
+        ssxy += dx * dy
+        ssyy += dy * dy
+
+    slope = ssxy / ssxx
+    intercept = y_mean - slope * x_mean
+    denom = np.sqrt(ssxx * ssyy)
+    r = 0.0
+    if denom > 0.0:
+        r = min(max(ssxy / denom, -1.0), 1.0)
+    return slope, intercept, r
+
+
+# Compile the (index, float64 price) signature pattern recognition uses at import
+warmup(fit_line, np.arange(3), np.zeros(3, np.float64))
+
+
+__all__ = ['fit_line']
@@ -0,0 +1,116 @@
+"""
+Rolling window kernels - O(n) replacements for pandas rolling reductions
+
+Outputs are NaN until a full window is available, matching pandas' default
+``min_periods=window``; a window holding a NaN is NaN as well.
+"""
+
+import numpy as np
+
+from app.utils.jit import njit, warmup
+
+
+@njit(cache=True)
+def rolling_max(a: np.ndarray, window: int) -> np.ndarray:
+    """Rolling maximum via a monotonic deque of indices"""
+    n = a.shape[0]
+    out = np.full(n, np.nan, np.float32)
+    dq = np.empty(n, np.int64)
+    head = 0
+    tail = 0
+    nans = 0
+    for i in range(n):
+        while head < tail and dq[head] <= i - window:
+            head += 1
+        if i >= window and a[i - window] != a[i - window]:
+            nans -= 1
+        if a[i] != a[i]:
+            nans += 1
+        else:
+            while head < tail and a[dq[tail - 1]] <= a[i]:
+                tail -= 1
+            dq[tail] = i
+            tail += 1
+        if i >= window - 1 and nans == 0:
+            out[i] = a[dq[head]]
+    return out
+
+
+@njit(cache=True)
+def rolling_min(a: np.ndarray, window: int) -> np.ndarray:
+    """Rolling minimum via a monotonic deque of indices"""
+    n = a.shape[0]
+    out = np.full(n, np.nan, np.float32)
+    dq = np.empty(n, np.int64)
+    head = 0
+    tail = 0
+    nans = 0
+    for i in range(n):
+        while head < tail and dq[head] <= i - window:
+            head += 1
+        if i >= window and a[i - window] != a[i - window]:
+            nans -= 1
+        if a[i] != a[i]:
+            nans += 1
+        else:
+            while head < tail and a[dq[tail - 1]] >= a[i]:
+                tail -= 1
+            dq[tail] = i
+            tail += 1
+        if i >= window - 1 and nans == 0:
+            out[i] = a[dq[head]]
+    return out
+
+
+@njit(cache=True)
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample std (ddof=1) with a sliding Welford update
+
+    Each step adds the newest value and removes the oldest, so the work per
+    step is O(1). NaNs are skipped; a window containing one yields NaN. Like
+    pandas, a window of identical values is exactly 0 rather than whatever
+    rounding the sliding update has accumulated.
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan, np.float32)
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    # Length of the run of equal values ending at the newest one
+    same_run = 0
+    last = np.nan
+    for i in range(n):
+        new = x[i]
+        if new == new:
+            count += 1
+            delta = new - mean
+            mean += delta / count
+            m2 += delta * (new - mean)
+            same_run = same_run + 1 if new == last else 1
+            last = new
+        if i >= window:
+            old = x[i - window]
+            if old == old:
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / count
+                    m2 -= delta * (old - mean)
+        if count == window and window > 1:
+            if same_run >= window:
+                out[i] = 0.0
+            else:
+                out[i] = np.sqrt(max(m2, 0.0) / (window - 1))
+    return out
+
+
+# Compile the signatures the tools use (float32 prices, float64 returns) at import
+warmup(rolling_max, np.zeros(30, np.float32), 20)
+warmup(rolling_min, np.zeros(30, np.float32), 20)
+warmup(rolling_std, np.zeros(30, np.float64), 20)
+
+
+__all__ = ['rolling_max', 'rolling_min', 'rolling_std']
@@ -0,0 +1,17 @@
+"""
+Ticker validation - one precompiled pattern shared by the CSV-backed tools
+"""
+
+import re
+
+# 1-5 letters with an optional share-class suffix (BRK.B, BRK-B). Anything
+# else, path separators included, cannot name a file in the data directory.
+SYMBOL_RE = re.compile(r"[A-Z]{1,5}(?:[.-][A-Z]{1,2})?")
+
+
+def is_valid_symbol(symbol: str) -> bool:
+    """True if an upper-cased symbol is a well-formed ticker"""
+    return SYMBOL_RE.fullmatch(symbol) is not None
+
+
+__all__ = ['SYMBOL_RE', 'is_valid_symbol']
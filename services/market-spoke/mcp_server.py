@@ -4,6 +4,7 @@ Market Spoke MCP Server - MCP SDK Implementation
 """
 import sys
 import os
+import asyncio
 from pathlib import Path
 import logging
 
@@ -51,6 +52,8 @@ from app.tools.anomaly_detection import AnomalyDetectionTool
 from app.tools.stock_comparison import StockComparisonTool
 from app.tools.sentiment_analysis import SentimentAnalysisTool
 from app.tools.alert_system import AlertSystemTool
+from shared.utils.serialization import dumps_result
+from app.clients.unified_api_manager import close_shared_manager
 
 # Create MCP server
 server = Server("fin-hub-market")
@@ -71,262 +74,270 @@ sentiment_tool = SentimentAnalysisTool()
 alert_tool = AlertSystemTool()
 
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List available market data tools"""
-    return [
-        types.Tool(
-            name="unified_market_data",
-            description="Get comprehensive market data from multiple sources with automatic fallback",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query_type": {
-                        "type": "string",
-                        "description": "Type of market data",
-                        "enum": ["stock_quote", "crypto_price", "news", "economic", "overview"]
-                    },
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock/crypto symbol (e.g., AAPL, BTC)"
-                    },
-                    "query": {
-                        "type": "string",
-                        "description": "Search query for news"
-                    },
-                    "indicator": {
-                        "type": "string",
-                        "description": "Economic indicator code (e.g., GDP, CPI)"
-                    }
+# Tool definitions are static, so build them once at import instead of per listing
+TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="unified_market_data",
+        description="Get comprehensive market data from multiple sources with automatic fallback",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query_type": {
+                    "type": "string",
+                    "description": "Type of market data",
+                    "enum": ["stock_quote", "crypto_price", "news", "economic", "overview"]
                 },
-                "required": ["query_type"]
-            }
-        ),
-        types.Tool(
-            name="stock_quote",
-            description="Get real-time stock quote data",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., AAPL, MSFT, GOOGL)"
-                    }
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock/crypto symbol (e.g., AAPL, BTC)"
                 },
-                "required": ["symbol"]
-            }
-        ),
-        types.Tool(
-            name="crypto_price",
-            description="Get cryptocurrency price data",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Cryptocurrency symbol (e.g., BTC, ETH)"
-                    }
+                "query": {
+                    "type": "string",
+                    "description": "Search query for news"
                 },
-                "required": ["symbol"]
-            }
-        ),
-        types.Tool(
-            name="financial_news",
-            description="Get latest financial news",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "News search query (e.g., 'Tesla earnings', 'Fed interest rates')"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of news articles to return (default: 10)",
-                        "default": 10
-                    }
+                "indicator": {
+                    "type": "string",
+                    "description": "Economic indicator code (e.g., GDP, CPI)"
+                }
+            },
+            "required": ["query_type"]
+        }
+    ),
+    types.Tool(
+        name="stock_quote",
+        description="Get real-time stock quote data",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock ticker symbol (e.g., AAPL, MSFT, GOOGL)"
+                }
+            },
+            "required": ["symbol"]
+        }
+    ),
+    types.Tool(
+        name="crypto_price",
+        description="Get cryptocurrency price data",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Cryptocurrency symbol (e.g., BTC, ETH)"
+                }
+            },
+            "required": ["symbol"]
+        }
+    ),
+    types.Tool(
+        name="financial_news",
+        description="Get latest financial news",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "News search query (e.g., 'Tesla earnings', 'Fed interest rates')"
                 },
-                "required": ["query"]
-            }
-        ),
-        types.Tool(
-            name="economic_indicator",
-            description="Get economic indicator data",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "indicator": {
-                        "type": "string",
-                        "description": "Economic indicator code (e.g., GDP, CPI, UNRATE)"
-                    }
+                "limit": {
+                    "type": "integer",
+                    "description": "Number of news articles to return (default: 10)",
+                    "default": 10
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    types.Tool(
+        name="economic_indicator",
+        description="Get economic indicator data",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "indicator": {
+                    "type": "string",
+                    "description": "Economic indicator code (e.g., GDP, CPI, UNRATE)"
+                }
+            },
+            "required": ["indicator"]
+        }
+    ),
+    types.Tool(
+        name="market_overview",
+        description="Get comprehensive market overview including major indices",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    types.Tool(
+        name="api_status",
+        description="Check status and availability of all data provider APIs",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    types.Tool(
+        name="technical_analysis",
+        description="Perform comprehensive technical analysis with indicators like RSI, MACD, Bollinger Bands, and Moving Averages",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock ticker symbol (e.g., AAPL, MSFT, GOOGL)"
                 },
-                "required": ["indicator"]
-            }
-        ),
-        types.Tool(
-            name="market_overview",
-            description="Get comprehensive market overview including major indices",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        types.Tool(
-            name="api_status",
-            description="Check status and availability of all data provider APIs",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        types.Tool(
-            name="technical_analysis",
-            description="Perform comprehensive technical analysis with indicators like RSI, MACD, Bollinger Bands, and Moving Averages",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
+                "indicators": {
+                    "type": "array",
+                    "items": {
                         "type": "string",
-                        "description": "Stock ticker symbol (e.g., AAPL, MSFT, GOOGL)"
-                    },
-                    "indicators": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["rsi", "macd", "bollinger", "sma", "ema", "all"]
-                        },
-                        "description": "List of indicators to calculate (default: all)"
+                        "enum": ["rsi", "macd", "bollinger", "sma", "ema", "all"]
                     },
-                    "period": {
-                        "type": "integer",
-                        "description": "Number of days for analysis (default: 30)"
-                    }
+                    "description": "List of indicators to calculate (default: all)"
                 },
-                "required": ["symbol"]
-            }
-        ),
-        types.Tool(
-            name="pattern_recognition",
-            description="Detect chart patterns, support/resistance levels, and trend analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., AAPL, MSFT)"
-                    },
-                    "period": {
-                        "type": "integer",
-                        "description": "Number of days for analysis (default: 60)"
-                    },
-                    "patterns": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["trend", "support_resistance", "head_shoulders", "double_top_bottom", "triangle", "all"]
-                        },
-                        "description": "Patterns to detect (default: all)"
-                    }
+                "period": {
+                    "type": "integer",
+                    "description": "Number of days for analysis (default: 30)"
+                }
+            },
+            "required": ["symbol"]
+        }
+    ),
+    types.Tool(
+        name="pattern_recognition",
+        description="Detect chart patterns, support/resistance levels, and trend analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock ticker symbol (e.g., AAPL, MSFT)"
+                },
+                "period": {
+                    "type": "integer",
+                    "description": "Number of days for analysis (default: 60)"
                 },
-                "required": ["symbol"]
-            }
-        ),
-        types.Tool(
-            name="anomaly_detection",
-            description="Detect price and volume anomalies using statistical methods (Z-Score, IQR, Volatility)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
+                "patterns": {
+                    "type": "array",
+                    "items": {
                         "type": "string",
-                        "description": "Stock ticker symbol (e.g., AAPL, MSFT)"
+                        "enum": ["trend", "support_resistance", "head_shoulders", "double_top_bottom", "triangle", "all"]
                     },
-                    "period": {
-                        "type": "integer",
-                        "description": "Number of days for analysis (default: 90)"
-                    },
-                    "sensitivity": {
-                        "type": "string",
-                        "enum": ["low", "medium", "high"],
-                        "description": "Detection sensitivity (default: medium)"
-                    }
+                    "description": "Patterns to detect (default: all)"
+                }
+            },
+            "required": ["symbol"]
+        }
+    ),
+    types.Tool(
+        name="anomaly_detection",
+        description="Detect price and volume anomalies using statistical methods (Z-Score, IQR, Volatility)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock ticker symbol (e.g., AAPL, MSFT)"
                 },
-                "required": ["symbol"]
-            }
-        ),
-        types.Tool(
-            name="stock_comparison",
-            description="Compare multiple stocks for correlation, performance, and relative analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbols": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of stock symbols to compare (2-10 stocks)"
-                    },
-                    "period": {
-                        "type": "integer",
-                        "description": "Number of days for analysis (default: 90)"
-                    },
-                    "metrics": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["correlation", "performance", "volatility", "risk_return", "all"]
-                        },
-                        "description": "Metrics to compare (default: all)"
-                    }
+                "period": {
+                    "type": "integer",
+                    "description": "Number of days for analysis (default: 90)"
                 },
-                "required": ["symbols"]
-            }
-        ),
-        types.Tool(
-            name="sentiment_analysis",
-            description="Enhanced sentiment analysis combining news sentiment with market data scoring (1-5 scale)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., AAPL, MSFT)"
-                    },
-                    "query": {
-                        "type": "string",
-                        "description": "Optional search query (default: company name from symbol)"
-                    },
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days to analyze (default: 7)"
-                    }
+                "sensitivity": {
+                    "type": "string",
+                    "enum": ["low", "medium", "high"],
+                    "description": "Detection sensitivity (default: medium)"
+                }
+            },
+            "required": ["symbol"]
+        }
+    ),
+    types.Tool(
+        name="stock_comparison",
+        description="Compare multiple stocks for correlation, performance, and relative analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbols": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of stock symbols to compare (2-10 stocks)"
                 },
-                "required": ["symbol"]
-            }
-        ),
-        types.Tool(
-            name="alert_system",
-            description="Monitor stocks and create alerts for price movements, breakouts, and pattern detection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., AAPL, MSFT)"
-                    },
-                    "alert_type": {
+                "period": {
+                    "type": "integer",
+                    "description": "Number of days for analysis (default: 90)"
+                },
+                "metrics": {
+                    "type": "array",
+                    "items": {
                         "type": "string",
-                        "enum": ["price_target", "percent_change", "volume_spike", "breakout", "support_resistance", "volatility", "all"],
-                        "description": "Type of alert to check"
+                        "enum": ["correlation", "performance", "volatility", "risk_return", "all"]
                     },
-                    "thresholds": {
-                        "type": "object",
-                        "description": "Alert thresholds"
-                    }
+                    "description": "Metrics to compare (default: all)"
+                },
+                "include_full_matrix": {
+                    "type": "boolean",
+                    "description": "Include the full correlation matrix in the correlation results (default: false)"
+                }
+            },
+            "required": ["symbols"]
+        }
+    ),
+    types.Tool(
+        name="sentiment_analysis",
+        description="Enhanced sentiment analysis combining news sentiment with market data scoring (1-5 scale)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock ticker symbol (e.g., AAPL, MSFT)"
+                },
+                "query": {
+                    "type": "string",
+                    "description": "Optional search query (default: company name from symbol)"
                 },
-                "required": ["symbol", "alert_type"]
-            }
-        )
-    ]
+                "days": {
+                    "type": "integer",
+                    "description": "Number of days to analyze (default: 7)"
+                }
+            },
+            "required": ["symbol"]
+        }
+    ),
+    types.Tool(
+        name="alert_system",
+        description="Monitor stocks and create alerts for price movements, breakouts, and pattern detection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock ticker symbol (e.g., AAPL, MSFT)"
+                },
+                "alert_type": {
+                    "type": "string",
+                    "enum": ["price_target", "percent_change", "volume_spike", "breakout", "support_resistance", "volatility", "all"],
+                    "description": "Type of alert to check"
+                },
+                "thresholds": {
+                    "type": "object",
+                    "description": "Alert thresholds"
+                }
+            },
+            "required": ["symbol", "alert_type"]
+        }
+    )
+]
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List available market data tools"""
+    return TOOLS
 
 
 @server.call_tool()
@@ -334,8 +345,6 @@ async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool execution"""
-    import json
-
     arguments = arguments or {}
 
     try:
@@ -370,7 +379,7 @@ async def handle_call_tool(
 
         return [types.TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=dumps_result(result)
         )]
 
     except Exception as e:
@@ -391,21 +400,27 @@ async def main():
     sys.stdin = original_stdin
     sys.stdout = original_stdout
 
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="fin-hub-market",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    # Precompute popular pattern results in the background while the server starts
+    warm_task = asyncio.create_task(pattern_tool.warm_cache())
+
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="fin-hub-market",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    )
                 )
             )
-        )
+    finally:
+        warm_task.cancel()
+        await close_shared_manager()
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
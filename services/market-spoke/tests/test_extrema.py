@@ -0,0 +1,53 @@
+"""
+Test Local Extrema Kernels
+
+Checks local_maxima/local_minima/local_extrema_pair index-for-index against
+scipy.signal.argrelextrema, which they replace.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add service directory to path
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from app.utils.extrema import local_extrema_pair, local_maxima, local_minima
+
+signal = pytest.importorskip("scipy.signal")
+
+
+def _plateau_arrays():
+    """Small-alphabet integer series, so equal neighbors and plateaus are common"""
+    rng = np.random.default_rng(5)
+    arrays = [rng.integers(0, 5, n).astype(np.float64) for n in (0, 1, 2, 3, 7, 30, 250)]
+    arrays.append(rng.integers(0, 3, 80).repeat(2).astype(np.float64))
+    arrays.append(np.array([1, 3, 3, 1, 0, 2, 0, 5, 5, 5, 0, 4, 1], dtype=np.float64))
+    arrays.append(np.full(20, 2.0))
+    return arrays
+
+
+@pytest.mark.parametrize("order", [1, 2, 3, 4, 5])
+def test_extrema_match_argrelextrema(order):
+    for a in _plateau_arrays():
+        expected_max = signal.argrelextrema(a, np.greater, order=order)[0]
+        expected_min = signal.argrelextrema(a, np.less, order=order)[0]
+
+        np.testing.assert_array_equal(local_maxima(a, order), expected_max)
+        np.testing.assert_array_equal(local_minima(a, order), expected_min)
+
+
+@pytest.mark.parametrize("order", [1, 2, 3, 4, 5])
+def test_extrema_pair_matches_argrelextrema(order):
+    rng = np.random.default_rng(order)
+    for n in (3, 40, 250):
+        highs = rng.integers(0, 6, n).astype(np.float64)
+        lows = highs - rng.integers(0, 3, n)
+
+        peaks, troughs = local_extrema_pair(highs, lows, order)
+
+        np.testing.assert_array_equal(peaks, signal.argrelextrema(highs, np.greater, order=order)[0])
+        np.testing.assert_array_equal(troughs, signal.argrelextrema(lows, np.less, order=order)[0])
@@ -0,0 +1,73 @@
+"""
+Test Regression Kernels
+
+Compares fit_line with scipy.stats.linregress, which it replaces.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add service directory to path
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from app.utils.regression import fit_line
+
+stats = pytest.importorskip("scipy.stats")
+
+
+def _assert_matches_linregress(x, y):
+    slope, intercept, r = fit_line(x, y)
+    expected = stats.linregress(x, y)
+
+    assert slope == pytest.approx(expected.slope, rel=1e-9, abs=1e-12)
+    assert intercept == pytest.approx(expected.intercept, rel=1e-9, abs=1e-9)
+    assert r == pytest.approx(expected.rvalue, rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("n", [3, 10, 60, 250])
+def test_random_prices_match_linregress(n):
+    rng = np.random.default_rng(n)
+    prices = 100 + rng.standard_normal(n).cumsum()
+
+    _assert_matches_linregress(np.arange(n), prices)
+
+
+def test_peak_indices_match_linregress():
+    # Trendlines are fitted through irregularly spaced extrema indices
+    x = np.array([4, 11, 19, 33, 41, 57])
+    y = np.array([101.5, 103.25, 102.0, 106.75, 108.5, 107.0])
+
+    _assert_matches_linregress(x, y)
+
+
+def test_constant_prices_have_zero_r():
+    x = np.arange(30)
+    y = np.full(30, 57.5)
+
+    slope, intercept, r = fit_line(x, y)
+
+    assert slope == 0.0
+    assert intercept == 57.5
+    assert r == 0.0
+    _assert_matches_linregress(x, y)
+
+
+@pytest.mark.parametrize("y", [[10.0, 12.5], [12.5, 10.0], [7.0, 7.0]])
+def test_two_points(y):
+    x = np.array([3, 8])
+    y = np.array(y)
+
+    slope, intercept, r = fit_line(x, y)
+
+    assert not np.isnan(r)
+    assert -1.0 <= r <= 1.0
+    _assert_matches_linregress(x, y)
+
+
+def test_identical_x_is_rejected():
+    with pytest.raises(ZeroDivisionError):
+        fit_line(np.array([5, 5, 5]), np.array([1.0, 2.0, 3.0]))
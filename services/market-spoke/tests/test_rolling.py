@@ -0,0 +1,82 @@
+"""
+Test Rolling Window Kernels
+
+Compares rolling_max/rolling_min/rolling_std with pandas rolling reductions.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add service directory to path
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from app.utils.rolling import rolling_max, rolling_min, rolling_std
+
+
+def _inputs():
+    """Random, constant and integer-plateau series"""
+    rng = np.random.default_rng(7)
+    return {
+        "random": 100 + rng.standard_normal(300).cumsum(),
+        "constant": np.full(120, 42.125),
+        "plateau": rng.integers(0, 4, 200).repeat(3).astype(np.float64),
+    }
+
+
+WINDOWS = [1, 2, 5, 20, 700]
+
+
+@pytest.mark.parametrize("name", ["random", "constant", "plateau"])
+@pytest.mark.parametrize("window", WINDOWS)
+def test_rolling_max_min_match_pandas(name, window):
+    a = _inputs()[name].astype(np.float32)
+    series = pd.Series(a)
+
+    np.testing.assert_array_equal(rolling_max(a, window), series.rolling(window).max().to_numpy(np.float32))
+    np.testing.assert_array_equal(rolling_min(a, window), series.rolling(window).min().to_numpy(np.float32))
+
+
+@pytest.mark.parametrize("name", ["random", "constant", "plateau"])
+@pytest.mark.parametrize("window", WINDOWS)
+def test_rolling_std_matches_pandas(name, window):
+    x = _inputs()[name]
+    expected = pd.Series(x).rolling(window).std().to_numpy()
+
+    result = rolling_std(x, window)
+
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6, equal_nan=True)
+
+
+@pytest.mark.parametrize("window", [2, 5, 20])
+def test_rolling_std_constant_windows_are_exactly_zero(window):
+    # A random walk that settles on a constant stretch
+    x = np.concatenate([100 + np.random.default_rng(3).standard_normal(50).cumsum(), np.full(60, 101.37)])
+    expected = pd.Series(x).rolling(window).std().to_numpy()
+
+    result = rolling_std(x, window)
+
+    assert np.all(result[-(60 - window + 1):] == 0.0)
+    assert np.all(expected[-(60 - window + 1):] == 0.0)
+
+
+@pytest.mark.parametrize("window", [1, 3, 10])
+def test_nan_windows_match_pandas(window):
+    x = 100 + np.random.default_rng(11).standard_normal(80).cumsum()
+    x[[0, 15, 16, 40, 79]] = np.nan
+    series = pd.Series(x)
+
+    np.testing.assert_array_equal(
+        rolling_max(x.astype(np.float32), window), series.rolling(window).max().to_numpy(np.float32)
+    )
+    np.testing.assert_array_equal(
+        rolling_min(x.astype(np.float32), window), series.rolling(window).min().to_numpy(np.float32)
+    )
+    np.testing.assert_allclose(
+        rolling_std(x, window), series.rolling(window).std().to_numpy(), rtol=1e-5, atol=1e-6, equal_nan=True
+    )
@@ -13,6 +13,7 @@ import pandas as pd
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import logging
+from heapq import nlargest
 
 # Internal utilities
 import sys
@@ -411,8 +412,7 @@ def _analyze_diversification(
         concentration = "High"
 
     # Top 3 holdings concentration
-    sorted_weights = sorted(weights.items(), key=lambda x: x[1], reverse=True)
-    top_3_concentration = sum([w for _, w in sorted_weights[:3]])
+    top_3_concentration = sum(nlargest(3, weights.values()))
 
     return {
         "effective_assets": round(effective_n, 2),
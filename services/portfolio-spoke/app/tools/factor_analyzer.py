@@ -16,6 +16,7 @@ import pandas as pd
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import logging
+from operator import itemgetter
 from scipy import stats
 
 # Internal utilities
@@ -327,9 +328,7 @@ def _generate_interpretation(
     """
     # Identify dominant factors
     abs_exposures = {k: abs(v) for k, v in factor_exposures.items()}
-    sorted_factors = sorted(abs_exposures.items(), key=lambda x: x[1], reverse=True)
-
-    top_factor, top_exposure = sorted_factors[0] if sorted_factors else ("none", 0)
+    top_factor, top_exposure = max(abs_exposures.items(), key=itemgetter(1), default=("none", 0))
     top_sign = "positive" if factor_exposures.get(top_factor, 0) > 0 else "negative"
 
     interpretation = (
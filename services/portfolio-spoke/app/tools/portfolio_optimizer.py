@@ -16,6 +16,8 @@ import pandas as pd
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 import logging
+from heapq import nlargest
+from operator import itemgetter
 
 # Portfolio optimization using scipy
 from scipy.optimize import minimize
@@ -483,8 +485,7 @@ def _generate_interpretation(
     Generate human-readable interpretation.
     """
     # Top holdings
-    sorted_weights = sorted(weights.items(), key=lambda x: x[1], reverse=True)
-    top_3 = sorted_weights[:3]
+    top_3 = nlargest(3, weights.items(), key=itemgetter(1))
     top_holdings = ", ".join([f"{t} ({w:.1%})" for t, w in top_3])
 
     # Diversification assessment
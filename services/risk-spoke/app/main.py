@@ -3,6 +3,7 @@ Risk Spoke - MCP Server for Risk Management Tools
 """
 import asyncio
 import json
+import os
 import sys
 from contextlib import asynccontextmanager
 from typing import Any, Dict, List
@@ -11,10 +12,14 @@ import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
+# Add shared directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
 from app.core.config import RiskSpokeConfig
 from app.services.hub_registration import HubRegistrationService
 from app.tools.anomaly_detector import AnomalyDetector
 from app.tools.compliance_checker import ComplianceChecker
+from shared.utils.serialization import dumps_result
 
 # Global configuration
 config = RiskSpokeConfig()
@@ -171,7 +176,7 @@ async def mcp_endpoint(request: Dict[str, Any]):
             response = {
                 "content": [{
                     "type": "text",
-                    "text": json.dumps(result, indent=2)
+                    "text": dumps_result(result)
                 }]
             }
 
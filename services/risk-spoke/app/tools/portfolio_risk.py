@@ -3,10 +3,11 @@ Portfolio Risk Analysis Tool
 Analyzes risk for a portfolio of multiple assets
 """
 
+import asyncio
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from scipy import stats
 from datetime import datetime
 
@@ -58,6 +59,18 @@ class PortfolioRiskTool:
             }
         }
 
+    def _load_close_prices(self, symbol: str, period: int) -> Optional[pd.Series]:
+        """Load the trailing close prices for a symbol, or None if unavailable"""
+        data_file = self.data_dir / f"{symbol}.csv"
+        if not data_file.exists():
+            return None
+
+        df = pd.read_csv(data_file, index_col=0, parse_dates=True)
+        if df.empty or 'Close' not in df.columns:
+            return None
+
+        return df['Close'].tail(period)
+
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute portfolio risk analysis"""
         try:
@@ -88,22 +101,20 @@ class PortfolioRiskTool:
             if not all(symbols):
                 return {"error": "All portfolio items must have a symbol"}
 
-            # Load data for all symbols
+            # Load data for all symbols concurrently; CSV parsing runs off the event loop
+            closes = await asyncio.gather(
+                *(asyncio.to_thread(self._load_close_prices, symbol, period) for symbol in symbols)
+            )
+
             price_data = {}
             missing_symbols = []
 
-            for symbol in symbols:
-                data_file = self.data_dir / f"{symbol}.csv"
-                if not data_file.exists():
+            for symbol, close in zip(symbols, closes):
+                if close is None:
                     missing_symbols.append(symbol)
                     continue
 
-                df = pd.read_csv(data_file, index_col=0, parse_dates=True)
-                if df.empty or 'Close' not in df.columns:
-                    missing_symbols.append(symbol)
-                    continue
-
-                price_data[symbol] = df['Close'].tail(period)
+                price_data[symbol] = close
 
             if missing_symbols:
                 return {"error": f"Data not available for: {', '.join(missing_symbols)}"}
@@ -134,10 +145,10 @@ class PortfolioRiskTool:
             # Portfolio returns
             if rebalance:
                 # Rebalance daily - use weighted average of returns
-                portfolio_returns = (returns_df * weights).sum(axis=1)
+                portfolio_returns = returns_df @ weights
             else:
                 # Buy and hold - calculate actual portfolio value changes
-                portfolio_value = (price_df / price_df.iloc[0] * weights).sum(axis=1)
+                portfolio_value = (price_df / price_df.iloc[0]) @ weights
                 portfolio_returns = portfolio_value.pct_change().dropna()
 
             # Basic return metrics
@@ -264,16 +275,11 @@ class PortfolioRiskTool:
         # Correlation matrix
         corr_matrix = returns_df.corr()
 
-        # Weighted average correlation
-        weighted_corr = 0
-        total_weight = 0
-        n = len(weights)
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                weight_product = weights[i] * weights[j]
-                weighted_corr += corr_matrix.iloc[i, j] * weight_product
-                total_weight += weight_product
+        # Weighted average correlation over distinct pairs (upper triangle)
+        upper = np.triu_indices(len(weights), k=1)
+        pair_weights = np.outer(weights, weights)[upper]
+        weighted_corr = np.dot(corr_matrix.to_numpy()[upper], pair_weights)
+        total_weight = pair_weights.sum()
 
         avg_correlation = weighted_corr / total_weight if total_weight > 0 else 0
 
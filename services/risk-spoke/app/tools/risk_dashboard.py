@@ -3,11 +3,14 @@ Risk Dashboard Tool
 Comprehensive risk analysis aggregating all risk metrics
 """
 
+import asyncio
 import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from heapq import nlargest
+from operator import itemgetter
 
 from .var_calculator import VaRCalculatorTool
 from .risk_metrics import RiskMetricsTool
@@ -267,30 +270,34 @@ class RiskDashboardTool:
             }
 
         # 2. Individual Asset Metrics (for top holdings)
-        top_holdings = sorted(portfolio, key=lambda x: x["weight"], reverse=True)[:3]
+        top_holdings = nlargest(3, portfolio, key=itemgetter("weight"))
         dashboard["top_holdings_analysis"] = []
 
-        for holding in top_holdings:
+        # VaR and risk metrics for every holding are independent of each other,
+        # so request them all at once
+        holding_results = await asyncio.gather(*(
+            asyncio.gather(
+                self.var_tool.execute({
+                    "symbol": holding["symbol"],
+                    "method": "historical",
+                    "confidence_level": confidence_level,
+                    "portfolio_value": portfolio_value * holding["weight"],
+                    "period": period
+                }),
+                self.metrics_tool.execute({
+                    "symbol": holding["symbol"],
+                    "metrics": ["sharpe", "volatility", "drawdown"],
+                    "period": period,
+                    "risk_free_rate": risk_free_rate
+                })
+            )
+            for holding in top_holdings
+        ))
+
+        for holding, (var_result, metrics_result) in zip(top_holdings, holding_results):
             symbol = holding["symbol"]
             weight = holding["weight"]
 
-            # Get VaR for each holding
-            var_result = await self.var_tool.execute({
-                "symbol": symbol,
-                "method": "historical",
-                "confidence_level": confidence_level,
-                "portfolio_value": portfolio_value * weight,
-                "period": period
-            })
-
-            # Get risk metrics for each holding
-            metrics_result = await self.metrics_tool.execute({
-                "symbol": symbol,
-                "metrics": ["sharpe", "volatility", "drawdown"],
-                "period": period,
-                "risk_free_rate": risk_free_rate
-            })
-
             holding_analysis = {
                 "symbol": symbol,
                 "weight_percent": weight * 100,
@@ -311,13 +318,16 @@ class RiskDashboardTool:
             for scenario in ["2008_financial_crisis", "2020_covid_crash"]:
                 scenario_impact = {"scenario": scenario, "holdings_impact": []}
 
-                for holding in portfolio:
-                    stress_result = await self.stress_tool.execute({
+                holding_stress = await asyncio.gather(*(
+                    self.stress_tool.execute({
                         "symbol": holding["symbol"],
                         "scenarios": [scenario],
                         "portfolio_value": portfolio_value * holding["weight"]
                     })
+                    for holding in portfolio
+                ))
 
+                for holding, stress_result in zip(portfolio, holding_stress):
                     if "error" not in stress_result and "scenarios" in stress_result:
                         scenario_data = stress_result["scenarios"].get(scenario, {})
                         scenario_impact["holdings_impact"].append({
@@ -6,60 +6,64 @@ Simulates portfolio performance under extreme market conditions
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from scipy import stats
 
 
+# Historical crisis scenarios (based on actual market data); read-only and shared
+# by every tool instance instead of being rebuilt per instance
+CRISIS_SCENARIOS = MappingProxyType({
+    "2008_financial_crisis": MappingProxyType({
+        "name": "2008 Global Financial Crisis",
+        "period": "Sep 2008 - Mar 2009",
+        "market_drop": -0.57,  # S&P 500 dropped 57%
+        "volatility_increase": 3.5,  # VIX increased 3.5x
+        "duration_days": 180,
+        "description": "Lehman Brothers collapse, credit crisis, housing bubble burst"
+    }),
+    "2020_covid_crash": MappingProxyType({
+        "name": "2020 COVID-19 Pandemic Crash",
+        "period": "Feb 2020 - Mar 2020",
+        "market_drop": -0.34,  # S&P 500 dropped 34%
+        "volatility_increase": 4.0,  # VIX spiked to 80+
+        "duration_days": 33,
+        "description": "Global pandemic, lockdowns, economic shutdown"
+    }),
+    "2022_inflation_shock": MappingProxyType({
+        "name": "2022 Inflation & Rate Hike Shock",
+        "period": "Jan 2022 - Oct 2022",
+        "market_drop": -0.25,  # S&P 500 dropped 25%
+        "volatility_increase": 1.8,
+        "duration_days": 280,
+        "description": "Aggressive Fed rate hikes, high inflation, recession fears"
+    }),
+    "2015_china_crash": MappingProxyType({
+        "name": "2015 China Stock Market Crash",
+        "period": "Jun 2015 - Aug 2015",
+        "market_drop": -0.43,  # Shanghai dropped 43%
+        "volatility_increase": 2.2,
+        "duration_days": 90,
+        "description": "Chinese stock market bubble burst, currency devaluation"
+    }),
+    "2011_euro_crisis": MappingProxyType({
+        "name": "2011 European Debt Crisis",
+        "period": "Jul 2011 - Oct 2011",
+        "market_drop": -0.19,  # S&P 500 dropped 19%
+        "volatility_increase": 2.5,
+        "duration_days": 105,
+        "description": "Greek debt crisis, eurozone instability"
+    })
+})
+
+
 class StressTestingTool:
     """Advanced stress testing with historical and custom scenarios"""
 
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent.parent.parent.parent / "data" / "stock-data"
-
-        # Historical crisis scenarios (based on actual market data)
-        self.crisis_scenarios = {
-            "2008_financial_crisis": {
-                "name": "2008 Global Financial Crisis",
-                "period": "Sep 2008 - Mar 2009",
-                "market_drop": -0.57,  # S&P 500 dropped 57%
-                "volatility_increase": 3.5,  # VIX increased 3.5x
-                "duration_days": 180,
-                "description": "Lehman Brothers collapse, credit crisis, housing bubble burst"
-            },
-            "2020_covid_crash": {
-                "name": "2020 COVID-19 Pandemic Crash",
-                "period": "Feb 2020 - Mar 2020",
-                "market_drop": -0.34,  # S&P 500 dropped 34%
-                "volatility_increase": 4.0,  # VIX spiked to 80+
-                "duration_days": 33,
-                "description": "Global pandemic, lockdowns, economic shutdown"
-            },
-            "2022_inflation_shock": {
-                "name": "2022 Inflation & Rate Hike Shock",
-                "period": "Jan 2022 - Oct 2022",
-                "market_drop": -0.25,  # S&P 500 dropped 25%
-                "volatility_increase": 1.8,
-                "duration_days": 280,
-                "description": "Aggressive Fed rate hikes, high inflation, recession fears"
-            },
-            "2015_china_crash": {
-                "name": "2015 China Stock Market Crash",
-                "period": "Jun 2015 - Aug 2015",
-                "market_drop": -0.43,  # Shanghai dropped 43%
-                "volatility_increase": 2.2,
-                "duration_days": 90,
-                "description": "Chinese stock market bubble burst, currency devaluation"
-            },
-            "2011_euro_crisis": {
-                "name": "2011 European Debt Crisis",
-                "period": "Jul 2011 - Oct 2011",
-                "market_drop": -0.19,  # S&P 500 dropped 19%
-                "volatility_increase": 2.5,
-                "duration_days": 105,
-                "description": "Greek debt crisis, eurozone instability"
-            }
-        }
+        self.crisis_scenarios = CRISIS_SCENARIOS
 
     async def get_tool_info(self) -> Dict:
         """Get tool information for MCP protocol"""
@@ -237,7 +241,7 @@ class StressTestingTool:
         returns_df = price_df.pct_change().dropna()
 
         # Portfolio returns
-        portfolio_returns = (returns_df * weights).sum(axis=1)
+        portfolio_returns = returns_df @ weights
 
         result = {
             "portfolio": portfolio,
@@ -302,8 +306,7 @@ class StressTestingTool:
         stressed_std = std_return * vol_increase
 
         # Simulate stressed returns
-        np.random.seed(42)
-        stressed_returns = np.random.normal(stressed_mean, stressed_std, duration)
+        stressed_returns = np.random.RandomState(42).normal(stressed_mean, stressed_std, duration)
 
         # Calculate outcomes
         cumulative_return = (1 + stressed_returns).prod() - 1
@@ -336,7 +339,7 @@ class StressTestingTool:
         duration = scenario["duration_days"]
 
         # Portfolio statistics
-        portfolio_returns = (returns_df * weights).sum(axis=1)
+        portfolio_returns = returns_df @ weights
         mean_return = portfolio_returns.mean()
         std_return = portfolio_returns.std()
 
@@ -345,8 +348,7 @@ class StressTestingTool:
         stressed_std = std_return * vol_increase
 
         # Simulate
-        np.random.seed(42)
-        stressed_returns = np.random.normal(stressed_mean, stressed_std, duration)
+        stressed_returns = np.random.RandomState(42).normal(stressed_mean, stressed_std, duration)
 
         cumulative_return = (1 + stressed_returns).prod() - 1
         loss = cumulative_return * 100
@@ -378,8 +380,7 @@ class StressTestingTool:
         stressed_mean = mean_return + (market_drop / duration)
         stressed_std = std_return * vol_increase
 
-        np.random.seed(42)
-        stressed_returns = np.random.normal(stressed_mean, stressed_std, duration)
+        stressed_returns = np.random.RandomState(42).normal(stressed_mean, stressed_std, duration)
 
         cumulative_return = (1 + stressed_returns).prod() - 1
         loss = cumulative_return * 100
@@ -404,15 +405,14 @@ class StressTestingTool:
         vol_increase = scenario.get("volatility_increase", 2.0)
         duration = scenario.get("duration_days", 60)
 
-        portfolio_returns = (returns_df * weights).sum(axis=1)
+        portfolio_returns = returns_df @ weights
         mean_return = portfolio_returns.mean()
         std_return = portfolio_returns.std()
 
         stressed_mean = mean_return + (market_drop / duration)
         stressed_std = std_return * vol_increase
 
-        np.random.seed(42)
-        stressed_returns = np.random.normal(stressed_mean, stressed_std, duration)
+        stressed_returns = np.random.RandomState(42).normal(stressed_mean, stressed_std, duration)
 
         cumulative_return = (1 + stressed_returns).prod() - 1
         loss = cumulative_return * 100
@@ -439,11 +439,11 @@ class StressTestingTool:
         extreme_mean = mean_return - 2 * std_return
 
         # Run simulations
-        np.random.seed(42)
+        rng = np.random.RandomState(42)
         simulation_results = []
 
         for _ in range(simulations):
-            scenario_returns = np.random.normal(extreme_mean, extreme_std, 60)  # 60 days
+            scenario_returns = rng.normal(extreme_mean, extreme_std, 60)  # 60 days
             cumulative = (1 + scenario_returns).prod() - 1
             simulation_results.append(cumulative)
 
@@ -471,18 +471,18 @@ class StressTestingTool:
         self, returns_df: pd.DataFrame, weights: np.ndarray, simulations: int
     ) -> Dict:
         """Portfolio worst case Monte Carlo"""
-        portfolio_returns = (returns_df * weights).sum(axis=1)
+        portfolio_returns = returns_df @ weights
         mean_return = portfolio_returns.mean()
         std_return = portfolio_returns.std()
 
         extreme_std = std_return * 3.0
         extreme_mean = mean_return - 2 * std_return
 
-        np.random.seed(42)
+        rng = np.random.RandomState(42)
         simulation_results = []
 
         for _ in range(simulations):
-            scenario_returns = np.random.normal(extreme_mean, extreme_std, 60)
+            scenario_returns = rng.normal(extreme_mean, extreme_std, 60)
             cumulative = (1 + scenario_returns).prod() - 1
             simulation_results.append(cumulative)
 
@@ -199,19 +199,20 @@ class TailRiskTool:
 
         # Calculate percentiles
         percentiles = [90, 95, 99, 99.5, 99.9]
-        actual_percentiles = {}
-        normal_percentiles = {}
+        labels = [f"{p}%" for p in percentiles]
 
         mean_loss = losses.mean()
         std_loss = losses.std()
 
-        for p in percentiles:
-            actual_percentiles[f"{p}%"] = round(np.percentile(losses, p) * 100, 4)
-            normal_percentiles[f"{p}%"] = round((mean_loss + stats.norm.ppf(p/100) * std_loss) * 100, 4)
+        # All levels in one percentile/ppf call each, rounded as whole arrays
+        actual = np.percentile(losses, percentiles)
+        normal = mean_loss + stats.norm.ppf(np.array(percentiles) / 100) * std_loss
+        actual_percentiles = dict(zip(labels, np.round(actual * 100, 4).tolist()))
+        normal_percentiles = dict(zip(labels, np.round(normal * 100, 4).tolist()))
 
         # Fat tail ratio (actual vs normal at 99%)
-        actual_99 = np.percentile(losses, 99)
-        normal_99 = mean_loss + stats.norm.ppf(0.99) * std_loss
+        actual_99 = actual[percentiles.index(99)]
+        normal_99 = normal[percentiles.index(99)]
         fat_tail_ratio = actual_99 / normal_99 if normal_99 > 0 else 1.0
 
         # Count of extreme events (beyond 3 standard deviations)
@@ -232,7 +233,7 @@ class TailRiskTool:
                 "expected_under_normality": round(expected_extreme, 2),
                 "multiplier": round(extreme_count / expected_extreme, 2) if expected_extreme > 0 else "N/A"
             },
-            "largest_losses": [round(x * 100, 4) for x in sorted(losses, reverse=True)[:5]]
+            "largest_losses": np.round(np.sort(losses.to_numpy())[::-1][:5] * 100, 4).tolist()
         }
 
     def _interpret_fat_tail(self, ratio: float) -> str:
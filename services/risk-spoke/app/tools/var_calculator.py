@@ -233,8 +233,9 @@ class VaRCalculatorTool:
         std_return = returns.std()
 
         # Generate random scenarios
-        np.random.seed(42)  # For reproducibility
-        random_returns = np.random.normal(mean_return, std_return, simulations)
+        # Seeded local generator for reproducibility; reseeding the global
+        # one would also reset it for every other caller in the process
+        random_returns = np.random.RandomState(42).normal(mean_return, std_return, simulations)
 
         # Scale to time horizon
         if horizon > 1:
@@ -15,6 +15,9 @@ import logging
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Add shared directory to path
+sys.path.append(str(project_root.parent.parent))
+
 # Load environment variables
 from dotenv import load_dotenv
 dotenv_path = project_root.parent / '.env'
@@ -46,6 +49,7 @@ from app.tools.tail_risk import TailRiskTool
 from app.tools.greeks_calculator import GreeksCalculatorTool
 from app.tools.compliance_checker import ComplianceCheckerTool
 from app.tools.risk_dashboard import RiskDashboardTool
+from shared.utils.serialization import dumps_result
 
 # Create MCP server
 server = Server("fin-hub-risk")
@@ -61,61 +65,28 @@ compliance_tool = ComplianceCheckerTool()
 dashboard_tool = RiskDashboardTool()
 
 
+# Tool schemas are static, so the MCP tool list is built once on first request
+_tool_list: list[types.Tool] | None = None
+
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available risk management tools (8 tools)"""
-    # Get tool info from each tool instance
-    var_info = await var_tool.get_tool_info()
-    metrics_info = await metrics_tool.get_tool_info()
-    portfolio_info = await portfolio_tool.get_tool_info()
-    stress_info = await stress_tool.get_tool_info()
-    tail_info = await tail_tool.get_tool_info()
-    greeks_info = await greeks_tool.get_tool_info()
-    compliance_info = await compliance_tool.get_tool_info()
-    dashboard_info = await dashboard_tool.get_tool_info()
-
-    return [
-        types.Tool(
-            name=var_info["name"],
-            description=var_info["description"],
-            inputSchema=var_info["inputSchema"]
-        ),
-        types.Tool(
-            name=metrics_info["name"],
-            description=metrics_info["description"],
-            inputSchema=metrics_info["inputSchema"]
-        ),
-        types.Tool(
-            name=portfolio_info["name"],
-            description=portfolio_info["description"],
-            inputSchema=portfolio_info["inputSchema"]
-        ),
-        types.Tool(
-            name=stress_info["name"],
-            description=stress_info["description"],
-            inputSchema=stress_info["inputSchema"]
-        ),
-        types.Tool(
-            name=tail_info["name"],
-            description=tail_info["description"],
-            inputSchema=tail_info["inputSchema"]
-        ),
-        types.Tool(
-            name=greeks_info["name"],
-            description=greeks_info["description"],
-            inputSchema=greeks_info["inputSchema"]
-        ),
-        types.Tool(
-            name=compliance_info["name"],
-            description=compliance_info["description"],
-            inputSchema=compliance_info["inputSchema"]
-        ),
-        types.Tool(
-            name=dashboard_info["name"],
-            description=dashboard_info["description"],
-            inputSchema=dashboard_info["inputSchema"]
+    global _tool_list
+    if _tool_list is None:
+        tools = (
+            var_tool, metrics_tool, portfolio_tool, stress_tool,
+            tail_tool, greeks_tool, compliance_tool, dashboard_tool
         )
-    ]
+        _tool_list = []
+        for tool in tools:
+            info = await tool.get_tool_info()
+            _tool_list.append(types.Tool(
+                name=info["name"],
+                description=info["description"],
+                inputSchema=info["inputSchema"]
+            ))
+    return _tool_list
 
 
 @server.call_tool()
@@ -123,8 +94,6 @@ async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool execution (8 tools)"""
-    import json
-
     arguments = arguments or {}
 
     try:
@@ -150,14 +119,14 @@ async def handle_call_tool(
 
         return [types.TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=dumps_result(result)
         )]
 
     except Exception as e:
         logging.error(f"Error executing {name}: {str(e)}", exc_info=True)
         return [types.TextContent(
             type="text",
-            text=json.dumps({"error": f"Tool execution failed: {str(e)}"}, indent=2)
+            text=dumps_result({"error": f"Tool execution failed: {str(e)}"})
         )]
 
 
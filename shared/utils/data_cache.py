@@ -476,7 +476,8 @@ class HistoricalDataDownloader:
         total_points = (365 * 24 * 60) // timeframe_minutes.get(timeframe, 1440)
         total_points = min(total_points, 50000)  # 최대 5만개 제한
 
-        base_price = 50000 if 'BTC' in symbol else 3000
+        base_asset = symbol.split('/', 1)[0]  # 'BTC/USDT' -> 'BTC'
+        base_price = 50000 if base_asset == 'BTC' else 3000
         current_time = datetime.now() - timedelta(days=365)
 
         for i in range(total_points):
@@ -13,10 +13,14 @@ from enum import Enum
 import statistics
 import logging
 from abc import ABC, abstractmethod
+from operator import attrgetter
 
 
 logger = logging.getLogger(__name__)
 
+# DataPoint 값 추출기 (리스트 컴프리헨션 대신 map과 함께 사용)
+_VALUE = attrgetter("value")
+
 
 class DataQuality(Enum):
     """데이터 품질 등급"""
@@ -145,7 +149,7 @@ class DataValidator:
         if len(data_points) < 3:
             return []
 
-        values = [dp.value for dp in data_points]
+        values = list(map(_VALUE, data_points))
         mean_val = statistics.mean(values)
         std_val = statistics.stdev(values) if len(values) > 1 else 0
 
@@ -179,7 +183,7 @@ class DataValidator:
             weighted_sum += dp.value * final_weight
             total_weight += final_weight
 
-        return weighted_sum / total_weight if total_weight > 0 else statistics.mean([dp.value for dp in data_points])
+        return weighted_sum / total_weight if total_weight > 0 else statistics.mean(list(map(_VALUE, data_points)))
 
     def _assess_data_quality(self, data_points: List[DataPoint], consensus_value: float) -> DataQuality:
         """데이터 품질 평가"""
@@ -251,7 +255,7 @@ class DataValidator:
         if not data_points:
             return {}
 
-        values = [dp.value for dp in data_points]
+        values = list(map(_VALUE, data_points))
 
         stats = {
             'mean': statistics.mean(values),
@@ -285,7 +289,7 @@ class DataValidator:
             warnings.append(f"Outliers detected: {', '.join(outliers)}")
 
         # 높은 변동성 경고
-        values = [dp.value for dp in data_points]
+        values = list(map(_VALUE, data_points))
         if len(values) > 1:
             cv = statistics.stdev(values) / statistics.mean(values) if statistics.mean(values) != 0 else 0
             if cv > 0.1:  # 10% 이상 변동
@@ -0,0 +1,41 @@
+"""
+Serialization Utilities for Fin-Hub Services
+Fast JSON encoding of tool results and MCP messages with a stdlib fallback
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_MESSAGE_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    _ORJSON_RESULT_OPTIONS = _ORJSON_MESSAGE_OPTIONS | orjson.OPT_INDENT_2
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    ORJSON_AVAILABLE = False
+
+
+def dumps_result(result: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode a tool result as indented JSON text.
+
+    orjson also encodes numpy scalars/arrays and datetimes natively, so tool
+    payloads do not need to be cast to builtins before they are returned.
+    ``default`` converts any other value JSON has no type for.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result, default=default, option=_ORJSON_RESULT_OPTIONS).decode()
+    return json.dumps(result, indent=2, default=default)
+
+
+def dumps_message(message: Any) -> str:
+    """Encode a JSON-RPC message compactly.
+
+    Values JSON has no type for are stringified; with orjson, datetimes are
+    written natively in ISO 8601 form.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message, default=str, option=_ORJSON_MESSAGE_OPTIONS).decode()
+    return json.dumps(message, default=str)
+
+
+__all__ = ['dumps_result', 'dumps_message', 'ORJSON_AVAILABLE']